@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Read API load test
+==================
+Publishes a week of synthetic articles (article store, history, index and
+shards) into a temporary directory, starts `fetcher.py --serve` on it and
+measures requests/sec and latency percentiles over a mix of endpoints:
+first requests (cache misses), repeated requests (cached, gzipped) and
+revalidation with If-None-Match (304 Not Modified).
+
+Usage: python benchmarks/bench_api.py [ARTICLES_PER_DAY] [REQUESTS] [CONNECTIONS]
+"""
+
+import http.client
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from urllib.parse import quote
+
+import numpy as np
+
+from corpus import make_entries
+import fetcher
+
+FETCHER = Path(fetcher.__file__).resolve()
+DAYS = 7
+
+
+def publish_week(per_day: int):
+    """Store a week of entries and publish the last 24h, in the current directory."""
+    now = datetime.now()
+    store = fetcher.open_store()
+    for d in range(DAYS):
+        fetcher.store_articles(store, fetcher.deduplicate(
+            make_entries(per_day, seed=d, now=now - timedelta(days=d))))
+    results = fetcher.aggregate_articles(fetcher.load_window(store))
+    store.close()
+    pairs = fetcher.extract_pairs(results)
+    scores = fetcher.score_countries(results, fetcher.calculate_baselines({'days': []}), pairs)
+    fetcher.publish(results, scores, pairs)
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind((fetcher.API_HOST, 0))
+        return s.getsockname()[1]
+
+
+def wait_ready(port: int, timeout: float = 30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection((fetcher.API_HOST, port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise TimeoutError(f"server did not start on port {port}")
+
+
+def endpoints() -> list[str]:
+    urls = ['/api/summary', '/api/countries', '/api/top?n=10', '/api/articles?hours=6']
+    for country in fetcher.COUNTRIES:
+        slug = quote(fetcher.shard_name(country)[:-len('.json')])
+        urls += [f'/api/countries/{slug}', f'/api/countries/{slug}/articles?days={DAYS}',
+                 f'/api/countries/{slug}/history?n=30']
+    urls += [f'/api/keywords/{quote(w.lower())}?hours=24' for w in fetcher.SIGNAL_KEYWORDS]
+    return urls
+
+
+def load(port: int, urls: list[str], connections: int,
+         etags: dict | None = None) -> tuple[float, np.ndarray, dict]:
+    """Send every URL in `urls`, spread over `connections` keep-alive connections.
+    
+    Returns (elapsed seconds, latencies in ms, {status: count}), and fills
+    `etags` with the ETag of each URL when given an empty dict.
+    """
+    latencies = []
+    statuses = {}
+    lock = threading.Lock()
+    
+    def client(share: list[str]):
+        conn = http.client.HTTPConnection(fetcher.API_HOST, port)
+        local = []
+        for url in share:
+            headers = {'Accept-Encoding': 'gzip'}
+            if etags and url in etags:
+                headers['If-None-Match'] = etags[url]
+            start = time.perf_counter()
+            conn.request('GET', url, headers=headers)
+            response = conn.getresponse()
+            response.read()
+            local.append((time.perf_counter() - start) * 1000)
+            with lock:
+                statuses[response.status] = statuses.get(response.status, 0) + 1
+                if etags is not None and not etags.get(url):
+                    etags[url] = response.getheader('ETag')
+        conn.close()
+        with lock:
+            latencies.extend(local)
+    
+    threads = [threading.Thread(target=client, args=(urls[i::connections],))
+               for i in range(connections)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - start, np.array(latencies), statuses
+
+
+def report(name: str, elapsed: float, latencies: np.ndarray, statuses: dict):
+    p50, p99 = np.percentile(latencies, [50, 99])
+    codes = ' '.join(f"{code}×{n}" for code, n in sorted(statuses.items()))
+    print(f"  {name:<12} {len(latencies) / elapsed:8,.0f} req/s  p50 {p50:6.2f}ms  "
+          f"p99 {p99:6.2f}ms  ({codes})")
+
+
+def main():
+    per_day = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    requests = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+    connections = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        print(f"Publishing {DAYS} days x {per_day:,} entries...")
+        publish_week(per_day)
+        
+        port = free_port()
+        server = subprocess.Popen([sys.executable, str(FETCHER), '--serve', str(port)],
+                                  stdout=subprocess.DEVNULL)
+        try:
+            wait_ready(port)
+            urls = endpoints()
+            rng = random.Random(42)
+            mix = rng.choices(urls, k=requests)
+            etags = {}
+            
+            print(f"{len(urls)} endpoints, {requests:,} requests over {connections} connections")
+            report('first hit', *load(port, urls, 1, etags))
+            report('cached', *load(port, mix, connections))
+            report('revalidate', *load(port, mix, connections, etags))
+        finally:
+            server.terminate()
+            server.wait()
+            os.chdir(Path(__file__).parent)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Feed fetching benchmark
+=======================
+Serves synthetic feeds from a local HTTP server: fast ones, one that answers
+after a quarter of the timeout, one that drips its body a few bytes at a
+time, one that never answers and one that returns 404. Fetches them all with fetch_feeds() and
+checks that the run takes about as long as the per-feed timeout (not the sum
+of the slow feeds), that every fast feed is parsed, and that each failure is
+reported on its own line.
+
+Usage: python benchmarks/bench_fetch.py [FAST_FEEDS] [TIMEOUT]
+"""
+
+import contextlib
+import io
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from corpus import SOURCES, make_entries, to_rss
+import fetcher
+
+ITEMS_PER_FEED = 50
+LATE_FRACTION = 0.25      # The late feed answers after this fraction of the timeout
+DRIP_BYTES = 10           # The drip feed sends this much...
+DRIP_INTERVAL = 0.5       # ...this often, far slower than any timeout allows
+HANG_SECONDS = 60         # The hanging feed sends nothing for this long
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    documents = {}  # Path -> RSS body for /fast/<n> and /late
+    late_delay = 0.0
+    
+    def send_feed(self, body: bytes, length: int | None = None):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/rss+xml; charset=utf-8')
+        self.send_header('Content-Length', str(length or len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def do_GET(self):
+        try:
+            if self.path.startswith('/fast/'):
+                self.send_feed(self.documents[self.path])
+            elif self.path == '/late':
+                time.sleep(self.late_delay)
+                self.send_feed(self.documents[self.path])
+            elif self.path == '/drip':
+                body = self.documents['/late']
+                self.send_feed(b'', len(body))
+                for i in range(0, len(body), DRIP_BYTES):
+                    self.wfile.write(body[i:i + DRIP_BYTES])
+                    self.wfile.flush()
+                    time.sleep(DRIP_INTERVAL)
+            elif self.path == '/hang':
+                time.sleep(HANG_SECONDS)
+            else:
+                self.send_error(404)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # The fetcher gave up, as it should
+    
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(fast: int) -> ThreadingHTTPServer:
+    for i in range(fast):
+        FeedHandler.documents[f'/fast/{i}'] = to_rss(
+            make_entries(ITEMS_PER_FEED, seed=i, raw=True), SOURCES[i % len(SOURCES)])
+    FeedHandler.documents['/late'] = to_rss(make_entries(ITEMS_PER_FEED, seed=fast, raw=True), 'Late')
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FeedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    fast = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    timeout = float(sys.argv[2]) if len(sys.argv) > 2 else 2.0
+    
+    FeedHandler.late_delay = timeout * LATE_FRACTION
+    server = serve(fast)
+    base = f'http://127.0.0.1:{server.server_address[1]}'
+    feeds = [{'name': f'Fast {i}', 'url': f'{base}/fast/{i}'} for i in range(fast)]
+    failing = {'Drip': f'{base}/drip', 'Hang': f'{base}/hang', 'Missing': f'{base}/missing'}
+    feeds += [{'name': 'Late', 'url': f'{base}/late'}]
+    feeds += [{'name': name, 'url': url} for name, url in failing.items()]
+    config = {
+        'fetch': {'concurrency': len(feeds), 'per_host': len(feeds), 'timeout': timeout},
+        'feeds': {'local': feeds},
+    }
+    
+    print(f"{len(feeds)} feeds ({fast} fast, late {FeedHandler.late_delay:g}s, drip, hang, 404), "
+          f"timeout {timeout}s")
+    fetcher.match_countries('warm up')
+    stats = {}
+    log = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(log):
+        entries = fetcher.fetch_feeds(config, {}, stats)
+    wall = time.perf_counter() - start
+    server.shutdown()
+    
+    print(log.getvalue().rstrip())
+    total = sum(s['seconds'] for s in stats.values())
+    print(f"  Wall {wall:.2f}s, sum of per-feed times {total:.2f}s, {len(entries):,} entries")
+    
+    problems = []
+    if wall > timeout + 1:
+        problems.append(f"wall time {wall:.2f}s exceeds the {timeout}s timeout")
+    for name in failing:
+        lines = [line for line in log.getvalue().splitlines() if line.strip().startswith(f'{name}...')]
+        if stats[name]['status'] != 'failed' or not lines or '✗' not in lines[0]:
+            problems.append(f"{name} was not reported as failed")
+    for name in [f['name'] for f in feeds if f['name'] not in failing]:
+        if stats[name]['status'] != 'fetched' or stats[name]['entries'] != ITEMS_PER_FEED:
+            problems.append(f"{name}: {stats[name]['status']}, {stats[name]['entries']} entries")
+    
+    for problem in problems:
+        print(f"  ✗ {problem}")
+    print("  OK" if not problems else f"  {len(problems)} problem(s)")
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
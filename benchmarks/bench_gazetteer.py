@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Gazetteer scaling benchmark
+===========================
+Grows the gazetteer with synthetic sub-national names (provinces, towns,
+armed groups) to about 300, 3k and 30k terms, and times for each size:
+compiling the matcher, loading it back from the on-disk cache, and matching
+a synthetic corpus in which half the articles mention one of those names.
+
+Usage: python benchmarks/bench_gazetteer.py [ENTRIES] [TERMS...]
+"""
+
+import copy
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from corpus import make_entries
+import fetcher
+
+SYLLABLES = ["ka", "bo", "ndu", "mer", "zi", "lo", "tam", "gu", "ra", "she", "wo", "ny",
+             "ki", "ma", "ba", "ou", "dji", "sa", "le", "mba", "ko", "ru", "ta", "vi"]
+
+
+def synthetic_terms(count: int, seed: int = 7) -> list[tuple[str, str, dict]]:
+    """(name, language, rule) for `count` made-up place and group names."""
+    rng = random.Random(seed)
+    terms = []
+    seen = set()
+    while len(terms) < count:
+        words = [''.join(rng.choices(SYLLABLES, k=rng.randint(2, 4))).capitalize()
+                 for _ in range(rng.choice((1, 1, 1, 2, 3)))]
+        name = rng.choice((' ', '-')).join(words)
+        if name.lower() in seen:
+            continue
+        seen.add(name.lower())
+        rule = {}
+        if rng.random() < 0.05:
+            rule['ambiguous'] = True
+        if rng.random() < 0.02:
+            rule['not_preceded_by'] = ['north ']
+        terms.append((name, rng.choice(('en', 'fr', '*')), rule))
+    return terms
+
+
+def grow(countries: dict, extra: list[tuple[str, str, dict]], seed: int = 7) -> dict:
+    """Copy of `countries` with each extra term added to a random country."""
+    rng = random.Random(seed)
+    grown = copy.deepcopy(countries)
+    names = list(grown)
+    for term, language, rule in extra:
+        info = grown[rng.choice(names)]
+        info['terms'].setdefault(language, []).append(term)
+        if rule:
+            info.setdefault('rules', {})[term] = rule
+    return grown
+
+
+def term_count(countries: dict) -> int:
+    return sum(len(group) for info in countries.values() for group in info['terms'].values())
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    sizes = [int(s) for s in sys.argv[2:]] or [300, 3_000, 30_000]
+    
+    base = fetcher.COUNTRIES
+    extra = synthetic_terms(max(sizes) - term_count(base))
+    
+    print(f"Generating {count:,} entries...")
+    rng = random.Random(42)
+    texts = []
+    for e in make_entries(count):
+        text = f"{e['title']} {e['summary']}"
+        if rng.random() < 0.5:
+            text += f" {rng.choice(extra)[0]}"
+        texts.append(fetcher.fold_accents(text.lower()))
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        fetcher.GAZETTEER_CACHE = Path(tmp) / 'gazetteer.cache'
+        for size in sizes:
+            fetcher.COUNTRIES = grow(base, extra[:max(0, size - term_count(base))])
+            
+            fetcher.GAZETTEER_CACHE.unlink(missing_ok=True)
+            fetcher.country_matcher.cache_clear()
+            compile_time = timed(fetcher.country_matcher)
+            fetcher.country_matcher.cache_clear()
+            load_time = timed(fetcher.country_matcher)
+            
+            match_time = timed(lambda: [fetcher.match_countries(t) for t in texts])
+            print(f"  {term_count(fetcher.COUNTRIES):>7,} terms  compile {compile_time * 1000:7.1f}ms  "
+                  f"cached load {load_time * 1000:6.1f}ms  "
+                  f"{len(texts) / match_time:9,.0f} articles/sec  "
+                  f"({fetcher.GAZETTEER_CACHE.stat().st_size / 2**20:.1f} MB cache)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Country matching benchmark
+==========================
+Compares the original per-term re.search loop with the token-trie matcher
+used by analyze_articles(), on a synthetic corpus.
+
+Usage: python benchmarks/bench_matching.py [ENTRIES]
+"""
+
+import re
+import sys
+import time
+
+from corpus import make_entries
+from fetcher import COUNTRIES, fold_accents, gazetteer_terms, match_countries
+
+
+def term_regex(term: str, rule: dict) -> str:
+    """A term and its exclusion rules as one regex, as the old matcher wrote them."""
+    before, after = ([re.escape(fold_accents(t.lower())) for t in rule.get(key, [])]
+                     for key in ('not_preceded_by', 'not_followed_by'))
+    return (''.join(f'(?<!{t})' for t in before)
+            + r'\b' + re.escape(fold_accents(term.lower())) + r'\b'
+            + ''.join(f'(?!{t})' for t in after))
+
+
+def legacy_match(text: str) -> list[str]:
+    """The pre-compiled-matcher loop: one re.search per term per country.
+    
+    Terms are accent-folded like the trie's, so both see the
+    same folded text. The gazetteer marks no term ambiguous, so ambiguity is
+    not handled here.
+    """
+    found = []
+    for country, info in COUNTRIES.items():
+        for term, rule in gazetteer_terms(info):
+            if re.search(term_regex(term, rule), text):
+                found.append(country)
+                break
+    return found
+
+
+def bench(name: str, func, texts: list[str]) -> list[list[str]]:
+    start = time.perf_counter()
+    matches = [func(text) for text in texts]
+    elapsed = time.perf_counter() - start
+    print(f"  {name:<10} {elapsed:7.2f}s  {len(texts) / elapsed:10,.0f} articles/sec")
+    return matches
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"Generating {count:,} entries...")
+    texts = [fold_accents(f"{e['title']} {e['summary']}".lower()) for e in make_entries(count)]
+    
+    match_countries(texts[0])  # Build the matcher outside the timed loop
+    before = bench('legacy', legacy_match, texts)
+    after = bench('trie', match_countries, texts)
+    
+    mismatches = sum(1 for a, b in zip(before, after) if a != b)
+    print(f"  Mismatched articles: {mismatches}")
+
+
+if __name__ == '__main__':
+    main()
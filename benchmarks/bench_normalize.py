@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Text normalization benchmark
+============================
+Parses and analyzes a heavy-HTML RSS corpus two ways: keeping raw summaries
+and stripping tags per use (the path before parse_entries() cleaned text),
+and cleaning each entry once at parse time. Reports CPU time, the memory
+held by the parsed entries and the peak traced memory of analysis, then
+checks that text around a literal "<" and past the old summary cut still
+matches.
+
+Usage: python benchmarks/bench_normalize.py [ENTRIES]
+"""
+
+import re
+import sys
+import time
+import tracemalloc
+
+import feedparser
+
+from corpus import SOURCES, make_entries, to_rss
+import fetcher
+
+ITEMS_PER_FEED = 50
+HEADERS = {'content-type': 'application/rss+xml; charset=utf-8'}
+
+# (title, summary HTML, country): "<" escaped in the feed, and a mention 1,000 characters in
+TEXT_CASES = [
+    ("Growth < 3% in Kenya as shilling slides", "<p>The currency fell again.</p>", 'Kenya'),
+    ("Shilling slides again", "<p>Inflation at 3 < 5 in Nairobi</p>", 'Kenya'),
+    ("Markets <b>update</b>", "<p>" + "Prices rose. " * 80 + "Traders in Bamako held out.</p>", 'Mali'),
+]
+
+
+def legacy_parse(body: bytes, headers: dict, source: str) -> list[dict]:
+    """parse_entries() as it was: summaries kept as raw HTML."""
+    parsed = feedparser.parse(body, response_headers=headers)
+    return [{
+        'title': entry.get('title', ''),
+        'link': entry.get('link', ''),
+        'summary': entry.get('summary', ''),
+        'published': None,
+        'source': source,
+    } for entry in parsed.entries]
+
+
+def legacy_analyze(entry: dict) -> tuple:
+    """Matching, lead, keywords and shingle text over the raw summary."""
+    summary = entry['summary']
+    text = f"{entry['title']} {summary}".lower()
+    countries = fetcher.match_countries(fetcher.fold_accents(text))
+    lead = re.sub(r'<[^>]+>', '', summary)[:120] if countries else ''
+    keywords = fetcher.extract_keywords(text) if countries else frozenset()
+    shingle_text = f"{entry['title']} {re.sub(r'<[^>]+>', ' ', summary)}".lower()
+    return countries, lead, keywords, re.findall(r'\w+', shingle_text)[:fetcher.SHINGLE_TOKENS]
+
+
+def current_analyze(entry: dict) -> tuple:
+    """The same work over text cleaned by parse_entries()."""
+    summary = entry['summary']
+    text = f"{entry['title']} {summary}".lower()
+    countries = fetcher.match_countries(fetcher.fold_accents(text))
+    lead = summary[:fetcher.LEAD_CHARS] if countries else ''
+    keywords = fetcher.extract_keywords(text) if countries else frozenset()
+    return countries, lead, keywords, re.findall(r'\w+', text)[:fetcher.SHINGLE_TOKENS]
+
+
+def held_mb(entries: list[dict]) -> float:
+    """Memory held by the entry dicts and their strings."""
+    return sum(sys.getsizeof(e) + sum(sys.getsizeof(v) for v in e.values())
+               for e in entries) / 2**20
+
+
+def bench(name: str, parse, analyze, feeds: list) -> list[tuple]:
+    cpu = time.process_time()
+    entries = [e for source, body in feeds for e in parse(body, HEADERS, source)]
+    parse_cpu = time.process_time() - cpu
+    
+    cpu = time.process_time()
+    analyzed = [analyze(e) for e in entries]
+    analyze_cpu = time.process_time() - cpu
+    
+    # Peak of the analysis pass alone: parsing allocates the same either way
+    tracemalloc.start()
+    for e in entries:
+        analyze(e)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    print(f"  {name:<8} parse {parse_cpu:6.2f}s  analyze {analyze_cpu:6.2f}s  "
+          f"entries hold {held_mb(entries):6.1f} MB  analysis peak {peak / 2**10:7.1f} KB")
+    return analyzed
+
+
+def check_text() -> list[str]:
+    """Countries found in TEXT_CASES after parse_entries() and analyze_entry()."""
+    rss = to_rss([{'title': t, 'link': f'https://example.org/{i}', 'summary': s, 'published': 0}
+                  for i, (t, s, _) in enumerate(TEXT_CASES)], 'Check')
+    problems = []
+    for entry, (_, _, country) in zip(fetcher.parse_entries(rss, HEADERS, 'Check'), TEXT_CASES):
+        if country not in fetcher.analyze_entry(entry)['countries']:
+            problems.append(f"{country} not matched in {entry['title']!r}: {entry['summary'][:60]!r}")
+    return problems
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    print(f"Generating {count:,} heavy-HTML entries...")
+    raw = make_entries(count, raw=True, heavy=True)
+    feeds = [(SOURCES[i % len(SOURCES)], to_rss(raw[i:i + ITEMS_PER_FEED], SOURCES[i % len(SOURCES)]))
+             for i in range(0, len(raw), ITEMS_PER_FEED)]
+    del raw
+    
+    fetcher.match_countries('warm up')
+    fetcher.extract_keywords('warm up')
+    before = bench('raw', legacy_parse, legacy_analyze, feeds)
+    after = bench('cleaned', fetcher.parse_entries, current_analyze, feeds)
+    
+    # Raw text matches inside attributes and URLs, and misses escaped names (S&eacute;n&eacute;gal)
+    lost = sum(len(set(a[0]) - set(b[0])) for a, b in zip(before, after))
+    gained = sum(len(set(b[0]) - set(a[0])) for a, b in zip(before, after))
+    print(f"  Country matches: {lost:,} found only in raw markup, {gained:,} only in cleaned text")
+    
+    problems = check_text()
+    for problem in problems:
+        print(f"  ✗ {problem}")
+    print(f"  Literal '<' and long summaries: {len(TEXT_CASES) - len(problems)}/{len(TEXT_CASES)} matched")
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Batch vs streaming pipeline benchmark
+=====================================
+Serves a synthetic corpus as RSS feeds from a local HTTP server and runs a
+whole pass over them twice: in batch (fetch_feeds() and a list per stage, as
+in main()) and streaming (iter_feed_entries() through generators, as with
+`fetcher.py --stream`). Both write a feed cache to a temporary directory as
+real runs do: batch keeps every record's entries in memory until it saves,
+streaming writes each feed's record as it completes. Each mode runs in a
+forked process; reports throughput, how far its peak RSS rose and the memory
+still held by the feed cache, and checks that both modes keep the same
+articles. Linux only (reads /proc/self/statm).
+
+Usage: python benchmarks/bench_pipeline.py [ENTRIES]
+"""
+
+import contextlib
+import io
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from corpus import SOURCES, make_entries, to_rss
+import fetcher
+from fetcher import (analyze_articles, counted, deduplicate, fetch_feeds, filter_recent,
+                     iter_feed_entries, iter_recent, iter_unique, match_countries,
+                     save_feed_cache)
+
+ITEMS_PER_FEED = 50
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    documents = {}  # Path -> RSS body
+    
+    def do_GET(self):
+        body = self.documents.get(self.path)
+        if body is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/rss+xml; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(count: int) -> tuple[ThreadingHTTPServer, dict]:
+    """Start a server for `count` entries in feeds of ITEMS_PER_FEED; returns it and the config."""
+    raw = make_entries(count, raw=True)
+    for n, i in enumerate(range(0, count, ITEMS_PER_FEED)):
+        FeedHandler.documents[f'/feed/{n}'] = to_rss(raw[i:i + ITEMS_PER_FEED],
+                                                     SOURCES[n % len(SOURCES)])
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FeedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    
+    base = f'http://127.0.0.1:{server.server_address[1]}'
+    feeds = [{'name': f'{SOURCES[n % len(SOURCES)]} {n}', 'url': f'{base}/feed/{n}'}
+             for n in range(len(FeedHandler.documents))]
+    return server, {'fetch': {'concurrency': 8, 'per_host': 8}, 'feeds': {'local': feeds}}
+
+
+def run_batch(config: dict, cache: dict, stats: dict) -> dict:
+    entries = fetch_feeds(config, cache)
+    save_feed_cache(cache)
+    recent = filter_recent(deduplicate(entries))
+    stats['recent'] = len(recent)
+    return analyze_articles(recent)
+
+
+def run_stream(config: dict, cache: dict, stats: dict) -> dict:
+    stats['recent'] = 0
+    results = analyze_articles(counted(iter_recent(iter_unique(iter_feed_entries(config, cache))),
+                                       stats, 'recent'))
+    save_feed_cache(cache)
+    return results
+
+
+def cache_mb(cache: dict) -> float:
+    """Memory held by the cached entries, as in load_feed_cache() output."""
+    return sum(sys.getsizeof(e) + sum(sys.getsizeof(v) for v in e.values())
+               for record in cache.values() for e in record.get('entries', ())) / 1e6
+
+
+def rss_mb() -> float:
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+
+
+def measure(func, config: dict, queue: multiprocessing.Queue):
+    """Run one mode in a forked child, whose peak RSS starts at its size on fork."""
+    base = rss_mb()
+    cache = {}
+    stats = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        fetcher.FEED_CACHE_DIR = Path(tmp)
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):  # Per-feed progress lines
+            results = func(config, cache, stats)
+        elapsed = time.perf_counter() - start
+    urls = {c: [a['url'] for a in d['articles']] for c, d in results.items()}
+    queue.put((elapsed, fetcher.peak_rss_mb() - base, cache_mb(cache), stats['recent'], urls))
+
+
+def bench(name: str, func, config: dict, count: int) -> tuple[dict, int]:
+    context = multiprocessing.get_context('fork')
+    queue = context.Queue()
+    child = context.Process(target=measure, args=(func, config, queue))
+    child.start()
+    elapsed, peak, cached, recent, urls = queue.get()
+    child.join()
+    
+    articles = sum(len(u) for u in urls.values())
+    print(f"  {name:<8} {elapsed:7.2f}s  {count / elapsed:9,.0f} entries/sec  "
+          f"RSS +{peak:6.1f} MB  (feed cache {cached:6.1f} MB)  "
+          f"recent {recent:,}  {articles:,} country articles")
+    return urls, recent
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    server, config = serve(count)
+    print(f"Pipeline over {count:,} entries in {len(config['feeds']['local'])} local feeds")
+    match_countries('warm up')  # Build matchers outside the measurement
+    
+    batch, batch_recent = bench('batch', run_batch, config, count)
+    stream, stream_recent = bench('stream', run_stream, config, count)
+    server.shutdown()
+    
+    same = batch_recent == stream_recent and batch == stream
+    print(f"  Same articles: {same}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Recency filtering benchmark
+===========================
+Answers the 6h, 24h and 72h windows (RECENT_WINDOWS) over a synthetic corpus
+three ways: ISO date strings parsed for every entry and window (the filter
+before entries carried epoch times), one pass per window over epoch times
+(iter_recent), and one sorted index searched per window (RecencyIndex).
+Results are checked identical.
+
+Usage: python benchmarks/bench_recency.py [ENTRIES]
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from corpus import make_entries
+import fetcher
+
+
+def legacy_recent(entries: list[dict], hours: int, now: datetime) -> list[dict]:
+    """iter_recent() as it was, over ISO strings."""
+    cutoff = now - timedelta(hours=hours)
+    recent = []
+    for entry in entries:
+        pub = entry.get('published')
+        if pub:
+            try:
+                dt = datetime.fromisoformat(pub.split('+')[0].split('Z')[0])
+                if dt >= cutoff:
+                    recent.append(entry)
+                continue
+            except (ValueError, TypeError, AttributeError):
+                pass
+        recent.append(entry)
+    return recent
+
+
+def bench(name: str, func) -> dict:
+    start = time.perf_counter()
+    windows = func()
+    elapsed = time.perf_counter() - start
+    print(f"  {name:<10} {elapsed * 1000:8.1f}ms  "
+          + '  '.join(f"{hours}h {len(w):,}" for hours, w in windows.items()))
+    return windows
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    print(f"Generating {count:,} entries...")
+    entries = make_entries(count, now=now)
+    # Entries as parse_entries() used to leave them: naive UTC ISO strings
+    iso = [{**e, 'published': datetime.fromtimestamp(e['published'], timezone.utc)
+            .replace(tzinfo=None).isoformat()} for e in entries]
+    naive_now = now.replace(tzinfo=None)
+    epoch_now = now.timestamp()
+    
+    before = bench('iso', lambda: {h: legacy_recent(iso, h, naive_now)
+                                   for h in fetcher.RECENT_WINDOWS})
+    scan = bench('epoch', lambda: {h: list(fetcher.iter_recent(entries, h, epoch_now))
+                                   for h in fetcher.RECENT_WINDOWS})
+    
+    def indexed():
+        index = fetcher.RecencyIndex(entries)
+        return {h: index.window(h, epoch_now) for h in fetcher.RECENT_WINDOWS}
+    after = bench('index', indexed)
+    
+    index = fetcher.RecencyIndex(entries)
+    start = time.perf_counter()
+    counts = {h: index.count(h, epoch_now) for h in fetcher.RECENT_WINDOWS}
+    print(f"  {'counts':<10} {(time.perf_counter() - start) * 1000:8.3f}ms  "
+          + '  '.join(f"{hours}h {n:,}" for hours, n in counts.items()) + "  (index built)")
+    
+    same = all([e['link'] for e in before[h]] == [e['link'] for e in scan[h]]
+               == [e['link'] for e in after[h]] for h in fetcher.RECENT_WINDOWS)
+    print(f"  Same windows: {same}")
+
+
+if __name__ == '__main__':
+    main()
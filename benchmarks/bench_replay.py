@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Replay throughput benchmark
+===========================
+Writes a synthetic archive (8 runs a day, feeds holding about two days of
+entries) into a temporary directory and times `replay()` over it.
+
+Usage: python benchmarks/bench_replay.py [DAYS] [ENTRIES_PER_DAY] [WORKERS]
+"""
+
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from corpus import make_entries
+import fetcher
+
+RUN_HOURS = (0, 3, 6, 9, 12, 15, 18, 21)
+
+
+def write_archive(days: int, per_day: int, first: datetime):
+    quiet = {c: {'status': 'quiet'} for c in fetcher.COUNTRIES}
+    previous = []
+    
+    for d in range(days):
+        day_end = first + timedelta(days=d + 1)
+        today = make_entries(per_day, seed=d, now=day_end)
+        pool = previous + today
+        
+        for hour in RUN_HOURS:
+            run_at = first + timedelta(days=d, hours=hour)
+            visible = [e for e in pool
+                       if run_at.timestamp() - 48 * 3600 <= e['published'] <= run_at.timestamp()]
+            archive = fetcher.RunArchive(run_at)
+            for _ in archive.tee(visible):
+                pass
+            archive.close(quiet)
+        
+        previous = today
+
+
+def main():
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 365
+    per_day = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        fetcher.ARCHIVE_DIR = Path(tmp) / 'archive'
+        fetcher.HISTORY_BIN = Path(tmp) / 'history.bin'
+        fetcher.HISTORY_FILE = Path(tmp) / 'history.json'
+        
+        first = datetime(2025, 1, 1)
+        print(f"Writing {days} days x {len(RUN_HOURS)} runs ({per_day:,} new entries/day)...")
+        start = time.perf_counter()
+        write_archive(days, per_day, first)
+        size = sum(p.stat().st_size for p in fetcher.ARCHIVE_DIR.iterdir())
+        print(f"  {time.perf_counter() - start:.1f}s, archive {size / 1e6:.1f} MB")
+        
+        last = (first + timedelta(days=days - 1)).strftime('%Y-%m-%d')
+        start = time.perf_counter()
+        reports = fetcher.replay(first.strftime('%Y-%m-%d'), last, workers)
+        elapsed = time.perf_counter() - start
+        
+        runs = sum(r['runs'] for r in reports)
+        print(f"  Replayed {runs:,} runs over {len(reports)} days in {elapsed:.1f}s "
+              f"({runs / elapsed:,.0f} runs/sec)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Per-stage pipeline benchmark
+============================
+Times each stage of a run separately on a synthetic English/French corpus
+and writes the results as JSON, so runs from different commits can be
+compared.
+
+Usage:
+    python benchmarks/bench_stages.py --entries 10000 --out bench.json
+    python benchmarks/bench_stages.py --entries 10000 --compare bench.json
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from corpus import SOURCES, make_entries, make_history, to_rss
+import fetcher
+
+ITEMS_PER_FEED = 50
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, cwd=Path(__file__).parent, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def timed(stages: dict, name: str, items: int, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    stages[name] = {'seconds': round(elapsed, 4), 'items': items,
+                    'per_sec': round(items / elapsed, 1) if elapsed else None}
+    print(f"  {name:<20} {elapsed:8.3f}s  {items:>9,} items  "
+          f"{items / elapsed if elapsed else float('inf'):>12,.0f}/s")
+    return result
+
+
+def run(entries_count: int, history_days: int) -> dict:
+    print(f"Generating {entries_count:,} entries...")
+    raw = make_entries(entries_count, raw=True)
+    history = make_history(history_days)
+    
+    # Feed documents, grouped the way fetch_feeds() sees them
+    feeds = [(SOURCES[i % len(SOURCES)], to_rss(raw[i:i + ITEMS_PER_FEED], SOURCES[i % len(SOURCES)]))
+             for i in range(0, len(raw), ITEMS_PER_FEED)]
+    headers = {'content-type': 'application/rss+xml; charset=utf-8'}
+    
+    fetcher.match_countries('warm up')
+    fetcher.extract_keywords('warm up')
+    stages = {}
+    
+    parsed = timed(stages, 'parse_feeds', entries_count,
+                   lambda: [fetcher.parse_entries(body, headers, source) for source, body in feeds])
+    entries = [entry for batch in parsed for entry in batch]
+    unique = timed(stages, 'deduplicate', len(entries), fetcher.deduplicate, entries)
+    recent = timed(stages, 'filter_recent', len(unique), fetcher.filter_recent, unique)
+    results = timed(stages, 'analyze_articles', len(recent), fetcher.analyze_articles, recent)
+    pairs = timed(stages, 'extract_pairs', sum(len(d['articles']) for d in results.values()),
+                  fetcher.extract_pairs, results)
+    baselines = timed(stages, 'calculate_baselines', len(history['days']),
+                      fetcher.calculate_baselines, history)
+    scores = timed(stages, 'score_countries', len(results),
+                   fetcher.score_countries, results, baselines, pairs)
+    timed(stages, 'generate_output', len(results), fetcher.generate_output,
+          results, scores, pairs, datetime.now().isoformat())
+    
+    return {
+        'commit': git_commit(),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'entries': entries_count,
+        'history_days': history_days,
+        'stages': stages,
+    }
+
+
+def compare(current: dict, previous: dict):
+    print(f"\nvs {previous.get('commit') or 'previous'} ({previous['entries']:,} entries):")
+    for name, stage in current['stages'].items():
+        before = previous['stages'].get(name)
+        if not before or not before['seconds']:
+            continue
+        change = stage['seconds'] / before['seconds']
+        flag = '  ⚠ slower' if change > 1.1 else ''
+        print(f"  {name:<20} {before['seconds']:8.3f}s → {stage['seconds']:8.3f}s  ({change:5.2f}x){flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--entries', type=int, default=10_000, help="corpus size (1k - 1M)")
+    parser.add_argument('--history-days', type=int, default=365)
+    parser.add_argument('--out', type=Path, help="write results as JSON")
+    parser.add_argument('--compare', type=Path, help="earlier JSON results to compare against")
+    args = parser.parse_args()
+    
+    report = run(args.entries, args.history_days)
+    
+    if args.out:
+        args.out.write_text(json.dumps(report, indent=2))
+        print(f"\nWrote {args.out}")
+    if args.compare:
+        compare(report, json.loads(args.compare.read_text()))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
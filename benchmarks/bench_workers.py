@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Analysis scaling benchmark
+==========================
+Times analyze_articles() over a deduplicated synthetic corpus with 1, 2, 4
+and 8 worker processes, and checks that every run gives the same results as
+a single process.
+
+Usage: python benchmarks/bench_workers.py [ENTRIES] [WORKERS...]
+"""
+
+import os
+import sys
+import time
+
+from corpus import make_entries
+from fetcher import analyze_articles, deduplicate, extract_pairs, match_countries
+
+
+def snapshot(results: dict) -> list:
+    """Comparable form of results and pairs (defaultdicts compare by order too)."""
+    return [{c: {k: list(v.items()) if isinstance(v, dict) else v for k, v in d.items()}
+             for c, d in results.items()},
+            extract_pairs(results)]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    counts = [int(w) for w in sys.argv[2:]] or [1, 2, 4, 8]
+    
+    entries = deduplicate(make_entries(count))
+    print(f"Analysis of {len(entries):,} entries ({os.cpu_count()} CPUs available)")
+    match_countries('warm up')  # Build matchers outside the measurement
+    
+    reference = None
+    single = None
+    for workers in counts:
+        start = time.perf_counter()
+        results = analyze_articles(entries, workers)
+        elapsed = time.perf_counter() - start
+        
+        single = single or elapsed
+        current = snapshot(results)
+        reference = reference or current
+        print(f"  {workers:>2} workers {elapsed:7.2f}s  {len(entries) / elapsed:9,.0f} entries/sec  "
+              f"x{single / elapsed:4.2f}  {'same' if current == reference else 'DIFFERENT'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+"""
+Synthetic feed corpus for benchmarks
+====================================
+Generates entry dicts shaped like fetch_feeds() output, with country terms
+and signal keywords sprinkled into English/French titles and HTML summaries,
+plus RSS documents and history to go with them.
+"""
+
+import email.utils
+import random
+import sys
+from xml.sax.saxutils import escape
+from collections.abc import Iterator
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fetcher import COUNTRIES, SIGNAL_KEYWORDS, normalize_entry  # noqa: E402
+
+FILLER = {
+    'en': ("the officials said on tuesday that talks would resume after a week of "
+           "tension in the region while local residents reported more people "
+           "leaving their homes as security forces moved in").split(),
+    'fr': ("les autorités ont annoncé mardi la reprise des discussions après une "
+           "semaine de tensions dans la région tandis que les habitants ont "
+           "signalé de nombreux départs à l'arrivée des forces de sécurité").split(),
+}
+
+SOURCES = ["BBC Africa", "Al Jazeera", "RFI Afrique", "France24 Afrique", "Le Monde Afrique",
+           "Africanews", "AllAfrica", "Daily Maverick", "The New Humanitarian", "ReliefWeb"]
+
+# Trailing HTML as it appears in francophone summaries (entities, inline markup)
+HTML_EXTRAS = [
+    '<p>Lire aussi&nbsp;: <a href="https://example.org/x">&laquo;&#160;Crise au S&#233;n&#233;gal&#160;&raquo;</a></p>',
+    '<p><em>Avec AFP &amp; Reuters</em></p>',
+    '<figure><img src="https://example.org/photo.jpg" alt="C&ocirc;te d&#39;Ivoire"/><figcaption>Abidjan</figcaption></figure>',
+    '',
+]
+
+# Bulky markup carried in full by some summaries (Daily Maverick, Le Monde): responsive
+# images, inline styles, share widgets and related links, about 3KB per entry
+HEAVY_HTML = (
+    '<figure class="wp-block-image size-large"><img loading="lazy" decoding="async" width="1024" '
+    'height="683" src="https://example.org/wp-content/uploads/2026/01/photo-1024x683.jpg" '
+    'srcset="https://example.org/photo-1024x683.jpg 1024w, https://example.org/photo-300x200.jpg 300w, '
+    'https://example.org/photo-768x512.jpg 768w, https://example.org/photo-1536x1024.jpg 1536w" '
+    'sizes="(max-width: 1024px) 100vw, 1024px" alt="" /><figcaption class="wp-element-caption">'
+    'Devant le si&#232;ge de la commission, le 9&nbsp;f&#233;vrier 2026. (Photo&nbsp;: &copy; AFP)</figcaption></figure>'
+    + ''.join(
+        f'<p style="margin:0 0 1em;font-family:Georgia,serif;line-height:1.6">'
+        f'<span class="dropcap">{i}</span> Paragraphe {i} &mdash; <strong>mise &agrave; jour</strong> '
+        f'<a href="https://example.org/related/{i}?utm_source=rss&amp;utm_medium=feed">&laquo;&nbsp;Lire la suite&nbsp;&raquo;</a></p>'
+        for i in range(8))
+    + '<div class="share-buttons"><a class="share-twitter" href="https://twitter.com/intent/tweet?url=https%3A%2F%2Fexample.org">'
+    '<svg viewBox="0 0 24 24" aria-hidden="true"><path d="M23 3a10.9 10.9 0 0 1-3.14 1.53 4.48 4.48 0 0 0-7.86 3v1A10.66 '
+    '10.66 0 0 1 3 4s-4 9 5 13a11.64 11.64 0 0 1-7 2c9 5 20 0 20-11.5"/></svg></a></div>'
+    '<style>.share-buttons{display:flex;gap:8px}</style>'
+)
+
+# Names that exercise the not_preceded_by/not_followed_by rules
+TRICKY = ["South Sudan", "Soudan du Sud", "Sud-Soudan", "Equatorial Guinea",
+          "Guinée équatoriale", "Guinea-Bissau", "Democratic Republic of Congo"]
+
+
+def iter_entries(count: int, seed: int = 42, duplicate_rate: float = 0.1,
+                 now: datetime | None = None, raw: bool = False, heavy: bool = False) -> Iterator[dict]:
+    """Lazily generate `count` synthetic feed entries published in the 48h before `now`.
+    
+    About `duplicate_rate` of them repeat an earlier title from another source.
+    Entries are cleaned as parse_entries() leaves them, unless `raw` keeps
+    the HTML summaries. `heavy` appends HEAVY_HTML to every summary.
+    """
+    rng = random.Random(seed)
+    terms = [t for info in COUNTRIES.values() for group in info['terms'].values() for t in group] + TRICKY
+    now = now or datetime.now()
+    recent_titles = []
+    
+    for i in range(count):
+        words = rng.choices(FILLER[rng.choice(('en', 'fr'))], k=rng.randint(30, 60))
+        for _ in range(rng.choice((0, 1, 1, 2, 3))):
+            words.insert(rng.randrange(len(words)), rng.choice(terms))
+        for _ in range(rng.choice((0, 1, 2))):
+            words.insert(rng.randrange(len(words)), rng.choice(SIGNAL_KEYWORDS))
+        
+        title = ' '.join(words[:12]).capitalize()
+        if recent_titles and rng.random() < duplicate_rate:
+            title = rng.choice(recent_titles)
+        else:
+            recent_titles = (recent_titles + [title])[-500:]
+        summary = (f'<p>{" ".join(words[12:])}</p><img src="https://example.org/{i}.jpg" alt="">'
+                   + rng.choice(HTML_EXTRAS) + (HEAVY_HTML if heavy else ''))
+        # Keep clear of the 24h cutoff so results don't depend on when filtering runs
+        age = rng.choice((rng.randint(0, 23 * 60), rng.randint(25 * 60, 48 * 60)))
+        
+        entry = {
+            'title': title,
+            'link': f'https://example.org/article/{i}',
+            'summary': summary,
+            'published': int(now.timestamp()) - age * 60,
+            'source': rng.choice(SOURCES),
+        }
+        yield entry if raw else normalize_entry(entry)
+
+
+def make_entries(count: int, seed: int = 42, duplicate_rate: float = 0.1,
+                 now: datetime | None = None, raw: bool = False, heavy: bool = False) -> list[dict]:
+    """Generate `count` synthetic feed entries."""
+    return list(iter_entries(count, seed, duplicate_rate, now, raw, heavy))
+
+
+def to_rss(entries: list[dict], title: str) -> bytes:
+    """Render entries as an RSS 2.0 document."""
+    items = []
+    for e in entries:
+        published = email.utils.formatdate(e['published'], usegmt=True)
+        items.append(
+            f"<item><title>{escape(e['title'])}</title><link>{escape(e['link'])}</link>"
+            f"<description>{escape(e['summary'])}</description><pubDate>{published}</pubDate></item>"
+        )
+    return (f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+            f'<title>{escape(title)}</title>{"".join(items)}</channel></rss>').encode('utf-8')
+
+
+def make_history(days: int, seed: int = 42) -> dict:
+    """Daily per-country counts around each country's default baseline."""
+    rng = random.Random(seed)
+    start = datetime.now() - timedelta(days=days)
+    return {'days': [{
+        'date': (start + timedelta(days=d)).strftime('%Y-%m-%d'),
+        'counts': {c: max(0, round(rng.gauss(info['baseline'], 2))) for c, info in COUNTRIES.items()},
+    } for d in range(days)]}
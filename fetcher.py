@@ -11,19 +11,56 @@ Design Principles:
 4. Use SENSIBLE DEFAULTS when no historical baseline exists
 """
 
+import bisect
+import calendar
+import cProfile
+import email.utils
+import functools
+import gc
+import gzip
 import json
 import hashlib
+import heapq
+import html
+import itertools
+import os
+import pickle
+import pstats
 import re
+import signal
+import sqlite3
+import struct
 import sys
-import socket
-from datetime import datetime, timedelta
+import threading
+import warnings
+import time
+import tracemalloc
+import unicodedata
+import urllib.error
+import urllib.request
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from collections import defaultdict
+from collections.abc import Iterable, Iterator
 from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlparse
 
 import feedparser
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
-# Set socket timeout for HTTP requests (feedparser uses urllib)
-socket.setdefaulttimeout(30)  # 30 seconds
+try:
+    import resource  # Unix only; peak RSS is left out of metrics elsewhere
+except ImportError:
+    resource = None
+
+try:
+    import brotli  # Optional; without it only .gz copies of the output are written
+except ImportError:
+    brotli = None
 
 # =============================================================================
 # CONFIGURATION
@@ -31,86 +68,121 @@ socket.setdefaulttimeout(30)  # 30 seconds
 
 CONFIG_FILE = "isitquiet_feeds.json"
 DATA_DIR = Path("data")
-HISTORY_FILE = DATA_DIR / "history.json"
-OUTPUT_FILE = DATA_DIR / "output.json"
-
-# Countries with matching terms
-# - "terms": simple strings, matched with word boundaries \b...\b
-# - "patterns": raw regex patterns for complex cases (lookahead/lookbehind)
-COUNTRIES = {
-    # North Africa
-    "Morocco": {"terms": ["Morocco", "Maroc", "Moroccan"], "baseline": 3},
-    "Algeria": {"terms": ["Algeria", "Algérie", "Algerian"], "baseline": 3},
-    "Tunisia": {"terms": ["Tunisia", "Tunisie", "Tunisian"], "baseline": 2},
-    "Libya": {"terms": ["Libya", "Libye", "Libyan", "Tripoli"], "baseline": 4},
-    "Egypt": {"terms": ["Egypt", "Égypte", "Egyptian", "Cairo"], "baseline": 5},
-    "Sudan": {
-        "terms": ["Sudanese", "Soudanais", "Khartoum", "Darfur", "RSF", "SAF"],
-        "patterns": [r"(?<!south )sudan\b", r"(?<!sud )soudan\b"],  # Sudan but not "South Sudan"
-        "baseline": 5
-    },
-    
-    # West Africa
-    "Mauritania": {"terms": ["Mauritania", "Mauritanie", "Nouakchott"], "baseline": 1},
-    "Mali": {"terms": ["Mali", "Malian", "Malien", "Bamako"], "baseline": 4},
-    "Burkina Faso": {"terms": ["Burkina Faso", "Burkina", "Burkinabè", "Ouagadougou"], "baseline": 4},
-    "Niger": {"terms": ["Niger", "Nigerien", "Nigérien", "Niamey"], "baseline": 3},  # Word boundary prevents "Nigeria" match
-    "Senegal": {"terms": ["Senegal", "Sénégal", "Senegalese", "Sénégalais", "Dakar"], "baseline": 3},
-    "Gambia": {"terms": ["Gambia", "Gambie", "Gambian", "Banjul"], "baseline": 1},
-    "Guinea-Bissau": {"terms": ["Guinea-Bissau", "Guinée-Bissau", "Bissau"], "baseline": 1},
-    "Guinea": {
-        "terms": ["Guinean", "Guinéen", "Conakry"],
-        "patterns": [r"(?<!equatorial )(?<!équatoriale )guinea\b(?!-)", r"(?<!équatoriale )guinée\b(?!-)"],  # Guinea but not compound names
-        "baseline": 2
-    },
-    "Sierra Leone": {"terms": ["Sierra Leone", "Freetown"], "baseline": 2},
-    "Liberia": {"terms": ["Liberia", "Liberian", "Monrovia"], "baseline": 2},
-    "Côte d'Ivoire": {"terms": ["Côte d'Ivoire", "Ivory Coast", "Ivorian", "Ivoirien", "Abidjan"], "baseline": 3},
-    "Ghana": {"terms": ["Ghana", "Ghanaian", "Ghanéen", "Accra"], "baseline": 3},
-    "Togo": {"terms": ["Togo", "Togolese", "Togolais", "Lomé"], "baseline": 1},
-    "Benin": {"terms": ["Benin", "Bénin", "Beninese", "Béninois", "Cotonou"], "baseline": 1},
-    "Nigeria": {"terms": ["Nigeria", "Nigerian", "Nigérian", "Abuja", "Lagos", "Boko Haram"], "baseline": 6},
-    "Cape Verde": {"terms": ["Cape Verde", "Cabo Verde", "Cap-Vert", "Praia"], "baseline": 0.5},
-    
-    # Central Africa
-    "Chad": {"terms": ["Chad", "Tchad", "Chadian", "Tchadien", "N'Djamena"], "baseline": 2},
-    "Cameroon": {"terms": ["Cameroon", "Cameroun", "Cameroonian", "Camerounais", "Yaoundé", "Douala"], "baseline": 3},
-    "CAR": {"terms": ["Central African Republic", "Centrafrique", "Centrafricain", "Bangui", "RCA"], "baseline": 2},
-    "South Sudan": {"terms": ["South Sudan", "Soudan du Sud", "Sud-Soudan", "South Sudanese", "Juba"], "baseline": 4},
-    "Eq. Guinea": {"terms": ["Equatorial Guinea", "Guinée équatoriale", "Malabo"], "baseline": 0.5},
-    "Gabon": {"terms": ["Gabon", "Gabonese", "Gabonais", "Libreville"], "baseline": 1},
-    "Congo": {"terms": ["Congo-Brazzaville", "Republic of Congo", "République du Congo", "Brazzaville"], "baseline": 1},
-    "DRC": {"terms": ["DRC", "RDC", "Democratic Republic of Congo", "République démocratique du Congo", "Congo-Kinshasa", "Kinshasa", "Goma", "M23", "Lubumbashi"], "baseline": 5},
-    "São Tomé": {"terms": ["São Tomé", "Sao Tome", "São Tomé-et-Príncipe"], "baseline": 0.5},
-    "Angola": {"terms": ["Angola", "Angolan", "Angolais", "Luanda"], "baseline": 2},
-    
-    # East Africa
-    "Eritrea": {"terms": ["Eritrea", "Érythrée", "Eritrean", "Érythréen", "Asmara"], "baseline": 2},
-    "Djibouti": {"terms": ["Djibouti", "Djiboutian", "Djiboutien"], "baseline": 1},
-    "Ethiopia": {"terms": ["Ethiopia", "Éthiopie", "Ethiopian", "Éthiopien", "Addis Ababa", "Addis-Abeba", "Tigray", "Amhara"], "baseline": 5},
-    "Somalia": {"terms": ["Somalia", "Somalie", "Somali", "Somalien", "Mogadishu", "Mogadiscio", "Al-Shabaab"], "baseline": 4},
-    "Uganda": {"terms": ["Uganda", "Ouganda", "Ugandan", "Ougandais", "Kampala"], "baseline": 3},
-    "Kenya": {"terms": ["Kenya", "Kenyan", "Kényan", "Nairobi", "Mombasa"], "baseline": 4},
-    "Rwanda": {"terms": ["Rwanda", "Rwandan", "Rwandais", "Kigali"], "baseline": 3},
-    "Burundi": {"terms": ["Burundi", "Burundian", "Burundais", "Bujumbura", "Gitega"], "baseline": 1},
-    "Tanzania": {"terms": ["Tanzania", "Tanzanie", "Tanzanian", "Tanzanien", "Dar es Salaam", "Dodoma"], "baseline": 3},
-    "Madagascar": {"terms": ["Madagascar", "Malagasy", "Malgache", "Antananarivo"], "baseline": 2},
-    "Comoros": {"terms": ["Comoros", "Comores", "Comorian", "Comorien", "Moroni"], "baseline": 0.5},
-    "Mauritius": {"terms": ["Mauritius", "Mauritian", "Mauricien", "Port Louis"], "baseline": 1},  # No "Maurice" - common French name
-    "Seychelles": {"terms": ["Seychelles", "Seychellois"], "baseline": 0.5},  # No "Victoria" - common name
-    
-    # Southern Africa
-    "Zambia": {"terms": ["Zambia", "Zambie", "Zambian", "Zambien", "Lusaka"], "baseline": 2},
-    "Malawi": {"terms": ["Malawi", "Malawian", "Malawien", "Lilongwe", "Blantyre"], "baseline": 1},
-    "Mozambique": {"terms": ["Mozambique", "Mozambican", "Mozambicain", "Maputo", "Beira"], "baseline": 3},
-    "Zimbabwe": {"terms": ["Zimbabwe", "Zimbabwean", "Zimbabwéen", "Harare", "Bulawayo"], "baseline": 3},
-    "Namibia": {"terms": ["Namibia", "Namibie", "Namibian", "Namibien", "Windhoek"], "baseline": 1},
-    "Botswana": {"terms": ["Botswana", "Motswana", "Batswana", "Gaborone"], "baseline": 1},
-    "South Africa": {"terms": ["South Africa", "Afrique du Sud", "South African", "Sud-Africain", "Johannesburg", "Cape Town", "Pretoria", "Durban"], "baseline": 5},
-    "Eswatini": {"terms": ["Eswatini", "Swaziland", "Swazi", "Mbabane"], "baseline": 0.5},
-    "Lesotho": {"terms": ["Lesotho", "Basotho", "Mosotho", "Maseru"], "baseline": 0.5},
+HISTORY_FILE = DATA_DIR / "history.json"  # JSON export of the trailing window
+HISTORY_BIN = DATA_DIR / "history.bin"
+HOURLY_BIN = DATA_DIR / "hourly.bin"  # Hourly counts ring buffer (see HourlySeries)
+ARCHIVE_DIR = DATA_DIR / "archive"  # Raw entries per run (--archive), for --replay
+INDEX_FILE = DATA_DIR / "index.json"  # Summary and scores for every country
+SHARD_DIR = DATA_DIR / "countries"  # One detail file per country, loaded on demand
+SHARD_FIELDS = ('keywords', 'keyword_pairs', 'articles', 'sources')  # Kept out of the index
+FEED_CACHE_DIR = DATA_DIR / "feed_cache"  # One record per feed: validators and parsed entries
+LEGACY_FEED_CACHE = DATA_DIR / "feed_cache.json"  # Single-file cache, split up on load
+ARTICLE_DB = DATA_DIR / "articles.db"
+STORE_RETENTION_DAYS = 14  # Articles kept in the store (--store)
+METRICS_FILE = DATA_DIR / "metrics.json"  # Per-run timings, charted by the dashboard
+METRICS_RETENTION = 60  # Runs kept in metrics.json, as many as the dashboard charts
+FEED_METRICS_FILE = DATA_DIR / "feed_metrics.json"  # Latest run's per-feed stats (not committed)
+PROFILE_DIR = DATA_DIR / "profile"  # cProfile/tracemalloc reports (--profile)
+
+# Read API (--serve): JSON query endpoints over the latest run
+API_HOST = "127.0.0.1"
+API_PORT = 8080
+API_CACHE_SIZE = 1024      # Responses kept in memory (LRU), dropped when a new run publishes
+API_GZIP_MIN = 1024        # Smaller responses are sent uncompressed
+API_DEFAULT_LIMIT = 100    # Articles per response unless ?limit= says otherwise
+API_MAX_LIMIT = 1000
+API_WINDOW_STEP = 60       # Seconds; ?hours=/?days= windows end on a step and are cached per step
+
+# Daemon mode (--daemon): each feed is polled on its own interval
+DAEMON_MIN_POLL = 5 * 60    # Seconds; never poll a feed more often than this
+DAEMON_MAX_POLL = 60 * 60   # ...or less often than this
+DAEMON_RESCORE = 10 * 60    # Re-score at least this often as articles age out of the window
+
+# Near-duplicate clustering (MinHash over word bigrams, LSH for candidates)
+NEAR_DUPLICATE_JACCARD = 0.5   # Estimated similarity at which articles are merged
+MINHASH_PERMUTATIONS = 64
+LSH_BANDS = 16                 # 4 rows per band: ~50% Jaccard has even odds of a shared band
+LSH_MAX_CANDIDATES = 8         # Clusters checked per band bucket
+SHINGLE_TOKENS = 80            # Words of title + summary used for shingles
+DEDUP_CHUNK = 512              # Entries hashed per vectorized batch
+MINHASH_BLOCK = 16             # Permutations hashed per pass, bounding the batch's temporary array
+MINHASH_SEED = 20260128
+
+# Text normalization (once per entry, right after parsing)
+LEAD_CHARS = 120           # Summary excerpt shown with each article
+ENTRY_FORMAT = 3           # Bump when parse_entries() output changes; older cached feeds are fetched again
+
+# Recency: entry 'published' times are UTC epoch seconds, set at parse time
+RECENT_WINDOWS = (6, 24, 72)  # Windows counted each run, from one sorted index (see RecencyIndex)
+
+# Analysis
+ANALYSIS_WORKERS = 1       # Processes used by analyze_articles (--workers)
+ANALYSIS_MIN_SHARD = 256   # Smaller shards cost more in pickling than they save
+
+# History file: header + one fixed-size record per day
+# (int32 date ordinal, then one int32 count per country in header order)
+HISTORY_MAGIC = b"MMBH"
+HISTORY_VERSION = 1
+HISTORY_MISSING = -1       # Count for a country not tracked that day
+BASELINE_DAYS = 30         # Trailing days used for baselines
+MIN_BASELINE_DAYS = 3      # Fewer days than this falls back to the COUNTRIES default
+BASELINE_METHOD = "mean"   # Policy used for live scoring
+BASELINE_METHODS = ("mean", "median", "ewma", "dow")
+MAD_HIGH_Z = 3.5           # Robust z-score tiers of the "mad" backtest method
+MAD_ELEVATED_Z = 2.0
+MAD_MIN_SCALE = 1.0        # Floor on 1.4826 * MAD, in articles (flat histories have MAD 0)
+HISTORY_EXPORT_DAYS = 90   # Trailing days written to history.json
+
+# Hourly series file: header + countries x slots int32 ring buffer
+HOURLY_MAGIC = b"MMBR"
+HOURLY_VERSION = 1
+HOURLY_DAYS = 90           # Ring size in days of 24 hourly slots
+
+USER_AGENT = "MyMonitoringBuddy/1.0"
+
+# Fetch settings - override in the "fetch" section of isitquiet_feeds.json
+# - "concurrency": feeds downloaded in parallel
+# - "timeout": seconds allowed per feed (a feed entry may set its own "timeout")
+# - "per_host": parallel requests to the same host ("hosts" overrides per hostname)
+# - "min_interval": minutes before a feed is re-requested (a feed may set its own)
+FETCH_DEFAULTS = {
+    "concurrency": 8,
+    "timeout": 30,
+    "per_host": 2,
+    "hosts": {},
+    "min_interval": 0,
 }
 
+# Gazetteer: the countries tracked, their region and default baseline, and
+# the terms that mention them (see gazetteer.json and the README)
+GAZETTEER_FILE = Path(__file__).with_name("gazetteer.json")
+GAZETTEER_CACHE = DATA_DIR / "gazetteer.cache"  # Compiled matcher, rebuilt when the gazetteer changes
+GAZETTEER_FORMAT = 1       # Bump when the compiled matcher changes shape
+GAZETTEER_LANGUAGES = None  # Term languages matched, e.g. ("en", "fr"); None matches all
+
+
+def load_gazetteer(path: Path = GAZETTEER_FILE) -> dict:
+    """Read the countries of a gazetteer file, in file order.
+    
+    Each country has a "region", a "baseline", "terms" grouped by language
+    ("*" for names shared across languages) and optional per-term "rules":
+    - "ambiguous": counts only alongside an unambiguous match in the same region
+    - "not_preceded_by" / "not_followed_by": text that vetoes a match when it
+      comes right before/after the term, e.g. "south " before "Sudan"
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        countries = json.load(f)['countries']
+    
+    for country, info in countries.items():
+        terms = {t.lower() for group in info['terms'].values() for t in group}
+        unknown = [t for t in info.get('rules', {}) if t.lower() not in terms]
+        if unknown:
+            raise ValueError(f"{path}: rules for unknown terms of {country}: {', '.join(unknown)}")
+    return countries
+
+
+COUNTRIES = load_gazetteer()
+
 # Signal keywords - presence indicates significance
 SIGNAL_KEYWORDS = [
     # Conflict
@@ -141,221 +213,1240 @@ def load_config() -> dict:
         return json.load(f)
 
 
-def fetch_feeds(config: dict) -> list[dict]:
-    """Fetch all RSS feeds."""
+def download(url: str, timeout: float, etag: str | None = None,
+             modified: str | None = None) -> tuple[bytes | None, dict]:
+    """Download a URL, giving up once `timeout` seconds have elapsed in total.
+    
+    Sends a conditional request when `etag`/`modified` are given and returns
+    a body of None if the server answers 304 Not Modified.
+    """
+    headers = {
+        'User-Agent': USER_AGENT,
+        'Accept-Encoding': 'gzip, deflate',
+    }
+    if etag:
+        headers['If-None-Match'] = etag
+    if modified:
+        headers['If-Modified-Since'] = modified
+    
+    request = urllib.request.Request(url, headers=headers)
+    deadline = time.monotonic() + timeout
+    chunks = []
+    
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            headers = {k.lower(): v for k, v in response.headers.items()}
+            # Each recv may only wait for what is left of the deadline, and read1()
+            # returns what has arrived instead of blocking for a full chunk, so a
+            # server dripping bytes cannot stretch the request past `timeout`
+            sock = getattr(getattr(response.fp, 'raw', None), '_sock', None)
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError
+                if sock is not None:
+                    sock.settimeout(remaining)
+                chunk = response.read1(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return None, {k.lower(): v for k, v in e.headers.items()}
+        raise
+    except TimeoutError:
+        raise TimeoutError(f"timed out after {timeout}s") from None
+    
+    body = b''.join(chunks)
+    encoding = headers.get('content-encoding', '')
+    if encoding == 'gzip':
+        body = gzip.decompress(body)
+    elif encoding == 'deflate':
+        body = zlib.decompress(body)
+    
+    headers.setdefault('content-location', url)
+    return body, headers
+
+
+def cache_max_age(headers: dict) -> int | None:
+    """Seconds a response may be cached for, from Cache-Control or Expires."""
+    match = re.search(r'max-age=(\d+)', headers.get('cache-control', ''))
+    if match:
+        return int(match.group(1))
+    if 'expires' in headers:
+        try:
+            expires = email.utils.parsedate_to_datetime(headers['expires'])
+            date = (email.utils.parsedate_to_datetime(headers['date']) if 'date' in headers
+                    else datetime.now(expires.tzinfo))
+            return max(int((expires - date).total_seconds()), 0)
+        except (TypeError, ValueError):
+            pass  # Invalid date, or "Expires: 0"
+    return None
+
+
+_EMBEDDED = re.compile(r'<(script|style)\b.*?</\1\s*>', re.S | re.I)  # Whole elements
+_MARKUP = re.compile(r'<[a-zA-Z/!?][^>]*>')  # Tags; any other "<" is text ("3 < 5")
+_SPACES = re.compile(r'\s+')
+
+
+def clean_text(text: str) -> str:
+    """Plain text of an HTML fragment.
+    
+    Strips script and style elements and tags, unescapes entities (&amp;,
+    &#233;), collapses whitespace and normalizes to NFC. A "<" that doesn't
+    open a tag is kept, as is everything after it.
+    """
+    if '<' in text:
+        text = _MARKUP.sub(' ', _EMBEDDED.sub(' ', text))
+    if '&' in text:
+        text = html.unescape(text)
+    text = _SPACES.sub(' ', text).strip()
+    if not text.isascii():
+        text = unicodedata.normalize('NFC', text)
+    return text
+
+
+@functools.lru_cache(maxsize=None)
+def _fold_table() -> dict[int, str]:
+    table = {}
+    for code in range(0xC0, 0x250):  # Latin-1 Supplement and Latin Extended-A/B
+        base = ''.join(c for c in unicodedata.normalize('NFD', chr(code))
+                       if not unicodedata.combining(c))
+        if len(base) == 1 and base != chr(code):
+            table[code] = base
+    return table
+
+
+def fold_accents(text: str) -> str:
+    """Drop diacritics from Latin letters ('sénégal' -> 'senegal'), one character for one.
+    
+    Used for country matching only: folding keywords would conflate words
+    such as 'tué' and 'tue'.
+    """
+    return text if text.isascii() else text.translate(_fold_table())
+
+
+def struct_epoch(parsed: time.struct_time | None) -> int | None:
+    """UTC epoch seconds of a feedparser date (a struct_time, always in UTC)."""
+    if not parsed:
+        return None
+    try:
+        return calendar.timegm(parsed)
+    except (ValueError, TypeError, OverflowError):
+        return None  # Out-of-range date
+
+
+def to_epoch(value) -> int | None:
+    """UTC epoch seconds of an entry time.
+    
+    Epoch seconds pass through. ISO strings, as entries held them before
+    parse_entries() produced epochs, are converted; without an offset they
+    are taken as UTC. Anything else is None.
+    """
+    if value is None or isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(value)
+    try:
+        dt = datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        return None
+    return int(dt.timestamp()) if dt.tzinfo else calendar.timegm(dt.timetuple())
+
+
+def normalize_entry(entry: dict) -> dict:
+    """Copy of an entry with clean title and summary text (see clean_text)
+    and its published time in epoch seconds."""
+    return {
+        **entry,
+        'title': clean_text(entry.get('title', '')),
+        'summary': clean_text(entry.get('summary', '')),
+        'published': to_epoch(entry.get('published')),
+    }
+
+
+def parse_entries(body: bytes, headers: dict, source: str,
+                  fetched_at: float | None = None) -> list[dict]:
+    """Parse a feed document into entry dicts with cleaned text.
+    
+    Summaries are reduced to plain text here, so the raw HTML is not kept
+    by the feed cache or any later stage. 'published' is
+    UTC epoch seconds; undated entries take the feed's own date, or else
+    `fetched_at` (default now), and are marked 'estimated'.
+    """
+    parsed = feedparser.parse(body, response_headers=headers)
+    feed_time = (struct_epoch(parsed.feed.get('updated_parsed'))
+                 or struct_epoch(parsed.feed.get('published_parsed')))
+    fallback = feed_time or int(time.time() if fetched_at is None else fetched_at)
     entries = []
     
-    for section, feeds in config.get('feeds', {}).items():
-        for feed in feeds:
-            url = feed['url']
-            source = feed['name']
-            
-            print(f"  {source}...", end=' ', flush=True)
-            
-            try:
-                parsed = feedparser.parse(url, request_headers={'User-Agent': 'MyMonitoringBuddy/1.0'})
-                
-                for entry in parsed.entries:
-                    published = None
-                    if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                        try:
-                            published = datetime(*entry.published_parsed[:6]).isoformat()
-                        except (ValueError, TypeError, IndexError):
-                            pass  # Invalid date format
-                    
-                    entries.append({
-                        'title': entry.get('title', ''),
-                        'link': entry.get('link', ''),
-                        'summary': entry.get('summary', ''),
-                        'published': published,
-                        'source': source,
-                    })
-                
-                print(f"✓ {len(parsed.entries)}")
-            except Exception as e:
-                print(f"✗ {e}")
+    for entry in parsed.entries:
+        published = (struct_epoch(entry.get('published_parsed'))
+                     or struct_epoch(entry.get('updated_parsed')))
+        item = {
+            'title': clean_text(entry.get('title', '')),
+            'link': entry.get('link', ''),
+            'summary': clean_text(entry.get('summary', '')),
+            'published': published or fallback,
+            'source': source,
+        }
+        if published is None:
+            item['estimated'] = True
+        entries.append(item)
     
     return entries
 
 
-def deduplicate(entries: list[dict]) -> list[dict]:
-    """Remove duplicate articles by title similarity."""
-    seen = {}
-    unique = []
+def feed_cache_path(url: str) -> Path:
+    return FEED_CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()[:16]}.json"
+
+
+def read_feed_record(path: Path) -> dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        record = json.load(f)
+    # Older records hold raw HTML summaries, ISO date strings or cut summaries.
+    # Their entries are normalized for use if the feed fails, and their
+    # validators dropped so it is fetched in full next time.
+    if record.get('normalized') != ENTRY_FORMAT:
+        record['entries'] = [normalize_entry(e) for e in record.get('entries', [])]
+        record['normalized'] = ENTRY_FORMAT
+        record['etag'] = record['last_modified'] = None
+    return record
+
+
+def save_feed_record(url: str, record: dict):
+    """Write one feed's cache record (with its URL) to its own file."""
+    FEED_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = feed_cache_path(url)
+    tmp = path.with_suffix('.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump({**record, 'url': url}, f, ensure_ascii=False, separators=(',', ':'))
+    tmp.replace(path)
+
+
+def load_feed_cache(entries: bool = True) -> dict:
+    """Feed cache records by URL, one file per feed in FEED_CACHE_DIR.
     
-    for entry in entries:
-        title = entry.get('title', '').strip()
-        if not title:
-            continue
-        
-        # Normalize: lowercase, remove punctuation, collapse spaces
-        normalized = re.sub(r'[^\w\s]', '', title.lower())
-        normalized = ' '.join(normalized.split())[:60]  # First 60 chars
-        
-        key = hashlib.md5(normalized.encode()).hexdigest()
-        
-        if key not in seen:
-            seen[key] = True
-            unique.append(entry)
+    Without `entries`, records keep only their validators and fetch_feed()
+    reads a feed's entries from its file when it needs them, so a streaming
+    run never holds every feed's entries at once.
+    """
+    if LEGACY_FEED_CACHE.exists():
+        with open(LEGACY_FEED_CACHE, 'r', encoding='utf-8') as f:
+            for url, record in json.load(f).items():
+                save_feed_record(url, record)
+        LEGACY_FEED_CACHE.unlink()
     
-    return unique
+    cache = {}
+    for path in sorted(FEED_CACHE_DIR.glob('*.json')):
+        record = read_feed_record(path)
+        if not entries:
+            del record['entries']
+        cache[record.pop('url')] = record
+    return cache
 
 
-def filter_recent(entries: list[dict], hours: int = 24) -> list[dict]:
-    """Keep entries from last N hours."""
-    cutoff = datetime.now() - timedelta(hours=hours)  # Use local time
-    recent = []
+def save_feed_cache(cache: dict):
+    """Write every record that holds entries; remove the files of feeds no longer cached."""
+    for url, record in cache.items():
+        if 'entries' in record:
+            save_feed_record(url, record)
+    kept = {feed_cache_path(url) for url in cache}
+    for path in FEED_CACHE_DIR.glob('*.json'):
+        if path not in kept:
+            path.unlink()
+
+
+def fetch_feed(feed: dict, timeout: float, cached: dict | None = None,
+               min_interval: float = 0, stats: dict | None = None) -> tuple[list[dict], dict, str]:
+    """Fetch and parse a single feed, reusing `cached` when it is still valid.
+    
+    Returns (entries, cache record, status) where status is 'fetched',
+    'not-modified' (server answered 304) or 'fresh' (polled too recently).
+    When a `stats` dict is given, download and parse seconds and the
+    (decompressed) body size are recorded in it.
+    """
+    if stats is None:
+        stats = {}
+    now = time.time()
+    cached = cached or {}
+    if cached and 'entries' not in cached:
+        # Loaded without entries (see load_feed_cache); read this feed's file
+        path = feed_cache_path(feed['url'])
+        cached = {**read_feed_record(path), **cached} if path.exists() else {}
+        cached.pop('url', None)
     
+    if cached and now - cached.get('fetched_at', 0) < min_interval * 60:
+        return cached['entries'], cached, 'fresh'
+    
+    start = time.perf_counter()
+    body, headers = download(feed['url'], timeout,
+                             etag=cached.get('etag'), modified=cached.get('last_modified'))
+    stats['download'] = time.perf_counter() - start
+    stats['bytes'] = len(body) if body is not None else 0
+    
+    if body is None:
+        record = {
+            **cached,
+            'etag': headers.get('etag', cached.get('etag')),
+            'last_modified': headers.get('last-modified', cached.get('last_modified')),
+            'max_age': cache_max_age(headers) or cached.get('max_age'),
+            'fetched_at': now,
+        }
+        return record['entries'], record, 'not-modified'
+    
+    start = time.perf_counter()
+    entries = parse_entries(body, headers, feed['name'], now)
+    stats['parse'] = time.perf_counter() - start
+    # Undated entries keep the earliest time given to them, so they still age out
+    estimated = {(e['link'], e['title']): e['published']
+                 for e in cached.get('entries', []) if e.get('estimated')}
     for entry in entries:
-        pub = entry.get('published')
-        if pub:
-            try:
-                # Normalize: remove timezone suffix for simple comparison
-                pub_str = pub.split('+')[0].split('Z')[0]
-                dt = datetime.fromisoformat(pub_str)
-                if dt >= cutoff:
-                    recent.append(entry)
-                # If date is valid but old, skip it (don't append)
+        first = estimated.get((entry['link'], entry['title'])) if entry.get('estimated') else None
+        if first is not None and first < entry['published']:
+            entry['published'] = first
+    record = {
+        'etag': headers.get('etag'),
+        'last_modified': headers.get('last-modified'),
+        'max_age': cache_max_age(headers),
+        'fetched_at': now,
+        'normalized': ENTRY_FORMAT,
+        'entries': entries,
+    }
+    return entries, record, 'fetched'
+
+
+def host_semaphores(feeds: list[dict], settings: dict) -> dict[str, threading.BoundedSemaphore]:
+    """One semaphore per host so a single site is never hit too hard."""
+    host_slots = {}
+    for feed in feeds:
+        host = urlparse(feed['url']).hostname or ''
+        if host not in host_slots:
+            limit = settings['hosts'].get(host, settings['per_host'])
+            host_slots[host] = threading.BoundedSemaphore(max(int(limit), 1))
+    return host_slots
+
+
+def poll_feed(feed: dict, settings: dict, host_slots: dict, cached: dict | None = None,
+              min_interval: float | None = None) -> tuple[list[dict], dict | None, str, dict, Exception | None]:
+    """fetch_feed() under the host's semaphore, catching errors.
+    
+    Returns (entries, cache record, status, timings, error); status is
+    'failed' and error is set when the feed could not be fetched.
+    """
+    if min_interval is None:
+        min_interval = feed.get('min_interval', settings['min_interval'])
+    timings = {}
+    with host_slots[urlparse(feed['url']).hostname or '']:
+        start = time.perf_counter()
+        try:
+            entries, record, status = fetch_feed(
+                feed,
+                feed.get('timeout', settings['timeout']),
+                cached=cached,
+                min_interval=min_interval,
+                stats=timings,
+            )
+            error = None
+        except Exception as e:
+            entries, record, status, error = [], None, 'failed', e
+        timings['seconds'] = time.perf_counter() - start
+    return entries, record, status, timings, error
+
+
+def iter_feeds(config: dict, cache: dict | None = None,
+               stats: dict | None = None) -> Iterator[tuple[int, list[dict]]]:
+    """Fetch all RSS feeds concurrently, yielding (feed index, entries) as each completes.
+    
+    Wall time is bounded by the slowest feed rather than the sum of all of
+    them. A feed that fails is yielded with no entries. When a `cache` dict
+    is given (see load_feed_cache) it is used for conditional requests and
+    updated in place. When a `stats` dict is given, each feed's status,
+    timings, size and entry count are recorded under its name.
+    """
+    settings = {**FETCH_DEFAULTS, **config.get('fetch', {})}
+    feeds = [feed for section in config.get('feeds', {}).values() for feed in section]
+    if cache is None:
+        cache = {}
+    
+    host_slots = host_semaphores(feeds, settings)
+    workers = max(int(settings['concurrency']), 1)
+    
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(poll_feed, feed, settings, host_slots, cache.get(feed['url'])): i
+                   for i, feed in enumerate(feeds)}
+        for future in as_completed(futures):
+            i = futures.pop(future)  # Let go of its entries once they are handed on
+            source = feeds[i]['name']
+            entries, record, status, timings, error = future.result()
+            elapsed = timings['seconds']
+            if stats is not None:
+                stats[source] = {'status': status, 'entries': len(entries),
+                                 **{k: round(v, 3) if isinstance(v, float) else v
+                                    for k, v in timings.items()}}
+            if error is not None:
+                print(f"  {source}... ✗ {error} ({elapsed:.1f}s)", flush=True)
+                yield i, []
                 continue
-            except (ValueError, TypeError, AttributeError):
-                pass  # Invalid date format
-        # No date or unparseable - include (might be recent)
-        recent.append(entry)
+            
+            cache[feeds[i]['url']] = record
+            if status == 'fetched':
+                print(f"  {source}... ✓ {len(entries)} ({elapsed:.1f}s)", flush=True)
+            elif status == 'not-modified':
+                print(f"  {source}... ↺ {len(entries)} unchanged ({elapsed:.1f}s)", flush=True)
+            else:
+                print(f"  {source}... ↺ {len(entries)} cached", flush=True)
+            yield i, entries
     
-    return recent
+    # Forget feeds that were removed from the config
+    urls = {feed['url'] for feed in feeds}
+    for url in [u for u in cache if u not in urls]:
+        del cache[url]
 
 
-def analyze_articles(entries: list[dict]) -> dict:
-    """Match articles to countries, extract keywords."""
-    results = {c: {'articles': [], 'sources': set(), 'keywords': defaultdict(int)} 
-               for c in COUNTRIES}
+def fetch_feeds(config: dict, cache: dict | None = None, stats: dict | None = None) -> list[dict]:
+    """Fetch all RSS feeds, returning entries in config order."""
+    results = {}
+    for i, entries in iter_feeds(config, cache, stats):
+        results[i] = entries
+    return [entry for i in sorted(results) for entry in results[i]]
+
+
+def iter_feed_entries(config: dict, cache: dict | None = None,
+                      stats: dict | None = None) -> Iterator[dict]:
+    """Fetch all RSS feeds, yielding entries in config order as feeds are parsed.
     
-    signal_words = set(w.lower() for w in SIGNAL_KEYWORDS)
+    A feed's entries are yielded once it and every feed before it have
+    completed; feeds that finish early wait for slower ones before them.
+    Deduplication then keeps the same first member of each cluster as
+    fetch_feeds() does, whatever order the downloads finish in.
     
-    for entry in entries:
-        title = entry.get('title', '')
-        summary = entry.get('summary', '')
-        text = f"{title} {summary}".lower()
-        source = entry.get('source', 'Unknown')
-        
-        if not text.strip():
-            continue
+    Each feed's cache record is written to its file (save_feed_record) as
+    soon as the feed completes, and kept in `cache` without its entries.
+    Feeds that finish early are read back from their files when their turn
+    comes, so memory holds the entries of a few feeds at a time.
+    """
+    feeds = [feed for section in config.get('feeds', {}).values() for feed in section]
+    if cache is None:
+        cache = {}
+    ready = {}  # Feed index -> entries, or None to read them back from its file
+    following = 0
+    for i, entries in iter_feeds(config, cache, stats):
+        url = feeds[i]['url']
+        record = cache.get(url, {})
+        on_file = record.get('entries') is entries  # A failed feed yields [] and keeps its record
+        if on_file:
+            save_feed_record(url, record)
+            cache[url] = {k: v for k, v in record.items() if k != 'entries'}
+        ready[i] = None if on_file and i != following else entries
+        while following in ready:
+            batch = ready.pop(following)
+            if batch is None:
+                batch = read_feed_record(feed_cache_path(feeds[following]['url']))['entries']
+            yield from batch
+            following += 1
+
+
+def title_key(title: str) -> str | None:
+    """Hash of the normalized title, shared by deduplication and the article store."""
+    title = title.strip()
+    if not title:
+        return None
+    
+    # Normalize: lowercase, remove punctuation, collapse spaces
+    normalized = re.sub(r'[^\w\s]', '', title.lower())
+    normalized = ' '.join(normalized.split())[:60]  # First 60 chars
+    
+    return hashlib.md5(normalized.encode()).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def minhash_params() -> tuple[np.ndarray, np.ndarray]:
+    """Fixed multiply-shift hash parameters, one (a, b) pair per permutation."""
+    rng = np.random.default_rng(MINHASH_SEED)
+    a = rng.integers(1, 2**63, size=MINHASH_PERMUTATIONS, dtype=np.uint64) | np.uint64(1)
+    b = rng.integers(0, 2**63, size=MINHASH_PERMUTATIONS, dtype=np.uint64)
+    return a, b
+
+
+def shingles(entry: dict) -> np.ndarray:
+    """Hashed word bigrams of the title and tag-stripped summary."""
+    text = f"{entry.get('title', '')} {entry.get('summary', '')}".lower()
+    tokens = re.findall(r'\w+', text)[:SHINGLE_TOKENS]
+    ids = np.fromiter((zlib.crc32(t.encode('utf-8')) for t in tokens), dtype=np.uint64,
+                      count=len(tokens))
+    if len(ids) > 1:
+        # Combine neighbouring token hashes into one 64-bit value per bigram
+        ids = (ids[:-1] << np.uint64(32)) | ids[1:]
+    return np.unique(ids)
+
+
+def minhash_signatures(shingle_sets: list[np.ndarray]) -> np.ndarray:
+    """MinHash signatures for a batch of shingle sets, shape (len, MINHASH_PERMUTATIONS).
+    
+    Every set must be non-empty.
+    """
+    a, b = minhash_params()
+    values = np.concatenate(shingle_sets)
+    offsets = np.cumsum([0] + [len(s) for s in shingle_sets[:-1]])
+    signatures = np.empty((len(shingle_sets), MINHASH_PERMUTATIONS), dtype=np.uint32)
+    with np.errstate(over='ignore'):  # Multiply-shift relies on uint64 wraparound
+        for lo in range(0, MINHASH_PERMUTATIONS, MINHASH_BLOCK):
+            block = slice(lo, lo + MINHASH_BLOCK)
+            hashed = np.multiply.outer(a[block], values)
+            hashed += b[block, None]
+            hashed >>= np.uint64(32)
+            signatures[:, block] = np.minimum.reduceat(hashed, offsets, axis=1).T
+    return signatures
+
+
+def lsh_bands(signature: np.ndarray) -> list[bytes]:
+    """LSH keys of a MinHash signature: each band's number followed by its bytes."""
+    raw = signature.tobytes()
+    width = len(raw) // LSH_BANDS
+    return [bytes([band]) + raw[band * width:(band + 1) * width] for band in range(LSH_BANDS)]
+
+
+def band_hashes(signatures: np.ndarray) -> list[list[int]]:
+    """In-memory LSH keys for a batch of signatures: one 64-bit hash per band.
+    
+    Cheaper to hold than lsh_bands() bytes; a collision only adds a
+    candidate, which is compared signature to signature anyway.
+    """
+    rows = signatures.view(np.uint64).reshape(len(signatures), LSH_BANDS, -1)
+    keys = rows[:, :, 0].copy()
+    with np.errstate(over='ignore'):
+        for i in range(1, rows.shape[2]):
+            keys *= np.uint64(0x9E3779B97F4A7C15)
+            keys ^= rows[:, :, i]
+        keys += np.arange(LSH_BANDS, dtype=np.uint64)  # Same bytes in another band
+    return keys.tolist()
+
+
+def iter_unique(entries: Iterable[dict], threshold: float = NEAR_DUPLICATE_JACCARD) -> Iterator[dict]:
+    """Yield one article per cluster of near-duplicates.
+    
+    Articles are clustered when their titles normalize to the same key, or
+    when the MinHash estimate of their shingle Jaccard similarity reaches
+    `threshold`. Candidates come from an LSH index (MINHASH_PERMUTATIONS
+    split into LSH_BANDS bands), so the cost is linear in the number of
+    entries. The first article of a cluster is yielded, as a copy whose
+    'sources' list collects every member's source - including members
+    that arrive after it was yielded. Its '_keys' list likewise collects
+    every member's title key, and '_signature' is its MinHash signature,
+    so the article store can recognise the cluster in later runs.
+    """
+    by_title = {}     # title_key -> cluster
+    buckets = {}      # LSH band hash -> cluster, or a list of clusters once shared
+    signatures = []   # cluster -> MinHash signature (None if no shingles)
+    sources = []      # cluster -> sources list shared with the yielded article
+    keys = []         # cluster -> title keys list shared with the yielded article
+    needed = threshold * MINHASH_PERMUTATIONS
+    
+    def join(cluster: int, source: str, key: str):
+        if source not in sources[cluster]:
+            sources[cluster].append(source)
+        if key not in keys[cluster]:
+            keys[cluster].append(key)
+    
+    iterator = iter(entries)
+    while chunk := list(itertools.islice(iterator, DEDUP_CHUNK)):
+        keyed = [(e, title_key(e.get('title', ''))) for e in chunk]
+        keyed = [(e, k) for e, k in keyed if k is not None]
+        sets = [shingles(e) for e, _ in keyed]
+        filled = [i for i, s in enumerate(sets) if len(s)]
+        chunk_signatures = [None] * len(keyed)
+        chunk_bands = [None] * len(keyed)
+        if filled:
+            batch = minhash_signatures([sets[i] for i in filled])
+            for i, sig, bands in zip(filled, batch, band_hashes(batch)):
+                chunk_signatures[i] = sig
+                chunk_bands[i] = bands
         
-        # Match countries - use word boundaries for terms, raw regex for patterns
-        for country, info in COUNTRIES.items():
-            matched = False
+        for (entry, key), sig, bands in zip(keyed, chunk_signatures, chunk_bands):
+            source = entry.get('source', 'Unknown')
             
-            # Check simple terms (with word boundaries)
-            for term in info.get('terms', []):
-                term_lower = term.lower()
-                pattern = r'\b' + re.escape(term_lower) + r'\b'
-                if re.search(pattern, text):
-                    matched = True
-                    break
-            
-            # Check raw patterns (for complex cases like Sudan, Guinea)
-            if not matched:
-                for pattern in info.get('patterns', []):
-                    if re.search(pattern, text):
-                        matched = True
+            cluster = by_title.get(key)
+            if cluster is None and sig is not None:
+                for band_key in bands:
+                    held = buckets.get(band_key, ())
+                    for candidate in (held,) if type(held) is int else held[:LSH_MAX_CANDIDATES]:
+                        if np.count_nonzero(signatures[candidate] == sig) >= needed:
+                            cluster = candidate
+                            break
+                    if cluster is not None:
                         break
             
-            if matched:
-                # Clean summary for lead
-                clean_summary = re.sub(r'<[^>]+>', '', summary)[:120]
-                
-                results[country]['articles'].append({
-                    'title': title,
-                    'url': entry.get('link', ''),
-                    'source': source,
-                    'published': entry.get('published'),
-                    'lead': clean_summary,
-                })
-                results[country]['sources'].add(source)
-                
-                # Extract signal keywords (use word boundaries)
-                for word in signal_words:
-                    pattern = r'\b' + re.escape(word) + r'\b'
-                    if re.search(pattern, text):
-                        results[country]['keywords'][word] += 1
-    
-    # Finalize
-    for country in results:
-        results[country]['sources'] = list(results[country]['sources'])
-        kw = sorted(results[country]['keywords'].items(), key=lambda x: -x[1])
-        results[country]['keywords'] = [{'word': w.capitalize(), 'count': c} for w, c in kw[:8]]
+            if cluster is not None:
+                by_title.setdefault(key, cluster)
+                join(cluster, source, key)
+                continue
+            
+            cluster = len(sources)
+            by_title[key] = cluster
+            signatures.append(sig)
+            sources.append([source])
+            keys.append([key])
+            if sig is not None:
+                for band_key in bands:
+                    held = buckets.get(band_key)
+                    if held is None:
+                        buckets[band_key] = cluster
+                    elif type(held) is int:
+                        buckets[band_key] = [held, cluster]
+                    else:
+                        held.append(cluster)
+            
+            yield {**entry, 'sources': sources[cluster], '_keys': keys[cluster], '_signature': sig}
+
+
+def deduplicate(entries: list[dict]) -> list[dict]:
+    """Collapse near-duplicate articles, keeping the first of each cluster."""
+    return list(iter_unique(entries))
+
+
+def iter_recent(entries: Iterable[dict], hours: int = 24,
+                now: float | None = None) -> Iterator[dict]:
+    """Yield entries from last N hours (before `now` in epoch seconds, default the current time)."""
+    cutoff = (time.time() if now is None else now) - hours * 3600
     
+    for entry in entries:
+        published = entry.get('published')
+        if published is None or published >= cutoff:
+            yield entry  # Undated entries are kept (might be recent)
+
+
+class RecencyIndex:
+    """Entries sorted by published time, answering any window by binary search.
+    
+    Built once over a run's entries; each window() or count() is then a
+    searchsorted over the sorted times rather than a pass over every entry.
+    Entries come back in their original order. Undated entries sort last
+    (as NaN) and so fall in every window, as in iter_recent().
+    """
+    
+    def __init__(self, entries: list[dict]):
+        self.entries = entries
+        times = np.array([entry.get('published') for entry in entries], dtype=np.float64)
+        self.order = np.argsort(times, kind='stable')
+        self.times = times[self.order]
+    
+    def start(self, hours: float, now: float | None = None) -> int:
+        cutoff = (time.time() if now is None else now) - hours * 3600
+        return int(np.searchsorted(self.times, cutoff))
+    
+    def window(self, hours: float = 24, now: float | None = None) -> list[dict]:
+        """Entries from the last N hours, in their original order."""
+        return [self.entries[i] for i in np.sort(self.order[self.start(hours, now):]).tolist()]
+    
+    def count(self, hours: float = 24, now: float | None = None) -> int:
+        return len(self.times) - self.start(hours, now)
+
+
+def filter_recent(entries: list[dict], hours: int = 24,
+                  now: float | None = None) -> list[dict]:
+    """Keep entries from last N hours."""
+    return RecencyIndex(entries).window(hours, now)
+
+
+def counted(entries: Iterable[dict], stats: dict, key: str) -> Iterator[dict]:
+    """Pass entries through, counting them into stats[key]."""
+    for entry in entries:
+        stats[key] += 1
+        yield entry
+
+
+# Words, whitespace runs and single punctuation marks. A term matches a run of
+# whole tokens, the same boundaries as a \b...\b regex.
+_TOKENS = re.compile(r"\w+|\s+|[^\w\s]")
+
+
+def gazetteer_terms(info: dict, languages: Iterable[str] | None = None) -> Iterator[tuple[str, dict]]:
+    """(term, rule) for each term of a COUNTRIES entry in `languages` (None: all)."""
+    rules = {t.lower(): rule for t, rule in info.get('rules', {}).items()}
+    for language, terms in info['terms'].items():
+        if languages is None or language == '*' or language in languages:
+            for term in terms:
+                yield term, rules.get(term.lower(), {})
+
+
+def compile_gazetteer(countries: dict, languages: Iterable[str] | None = None) -> tuple[dict, dict, dict]:
+    """Build a token trie of every lowercased, accent-folded term.
+    
+    Each node maps the next token to a child node. The '' key of a node lists
+    a (country, ambiguous, not_preceded_by, not_followed_by) hit for each term
+    ending there. Also returns each country's region and COUNTRIES position.
+    """
+    root = {}
+    for country, info in countries.items():
+        for term, rule in gazetteer_terms(info, languages):
+            node = root
+            for token in _TOKENS.findall(fold_accents(term.lower())):
+                node = node.setdefault(token, {})
+            hit = (country, bool(rule.get('ambiguous')),
+                   tuple(fold_accents(t.lower()) for t in rule.get('not_preceded_by', [])),
+                   tuple(fold_accents(t.lower()) for t in rule.get('not_followed_by', [])))
+            hits = node.setdefault('', [])
+            if hit not in hits:
+                hits.append(hit)
+    
+    regions = {country: info.get('region') for country, info in countries.items()}
+    order = {country: i for i, country in enumerate(countries)}
+    return root, regions, order
+
+
+@functools.lru_cache(maxsize=None)
+def country_matcher() -> tuple[dict, dict, dict]:
+    """The compiled gazetteer (see compile_gazetteer), built once.
+    
+    The trie is kept in GAZETTEER_CACHE under a hash of COUNTRIES and
+    GAZETTEER_LANGUAGES, so later runs and worker processes load it instead
+    of compiling tens of thousands of terms again.
+    """
+    key = hashlib.sha256(json.dumps([GAZETTEER_FORMAT, GAZETTEER_LANGUAGES, COUNTRIES],
+                                    sort_keys=True).encode('utf-8')).hexdigest()
+    try:
+        with open(GAZETTEER_CACHE, 'rb') as f:
+            if f.readline().decode('ascii', 'replace').strip() == key:
+                gc.disable()  # Unpickling many small dicts otherwise triggers repeated collections
+                try:
+                    return pickle.load(f)
+                finally:
+                    gc.enable()
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass  # Missing or damaged cache: compile
+    
+    matcher = compile_gazetteer(COUNTRIES, GAZETTEER_LANGUAGES)
+    GAZETTEER_CACHE.parent.mkdir(exist_ok=True)
+    tmp = GAZETTEER_CACHE.with_name(f"{GAZETTEER_CACHE.name}.{os.getpid()}.tmp")
+    with open(tmp, 'wb') as f:
+        f.write(key.encode('ascii') + b'\n')
+        pickle.dump(matcher, f, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp.replace(GAZETTEER_CACHE)
+    return matcher
+
+
+def match_countries(text: str) -> list[str]:
+    """Return every country mentioned in lowercased, accent-folded `text`, in COUNTRIES order.
+    
+    Each token is looked up in the trie and followed for as long as the next
+    tokens continue some term, so the cost per article depends on its length
+    rather than on the number of terms.
+    """
+    root, regions, order = country_matcher()
+    tokens = _TOKENS.findall(text)
+    found = set()
+    ambiguous = set()
+    
+    for i, token in enumerate(tokens):
+        node = root.get(token)
+        end = i + 1
+        while node is not None:
+            for country, weak, before, after in node.get('', ()):
+                if before and ''.join(tokens[max(0, i - max(map(len, before))):i]).endswith(before):
+                    continue
+                if after and ''.join(tokens[end:end + max(map(len, after))]).startswith(after):
+                    continue
+                (ambiguous if weak else found).add(country)
+            node = node.get(tokens[end]) if end < len(tokens) else None
+            end += 1
+    
+    # An ambiguous term needs an unambiguous mention from the same region
+    regions_found = {regions[c] for c in found} - {None}
+    found.update(c for c in ambiguous if regions[c] in regions_found)
+    return sorted(found, key=order.__getitem__)
+
+
+@functools.lru_cache(maxsize=None)
+def keyword_matcher() -> tuple[re.Pattern, dict]:
+    """Compile SIGNAL_KEYWORDS once into a single word-bounded scanner.
+    
+    Only one keyword is reported per position, so keywords that are a
+    word-prefix of a longer one ("armed" inside "armed group") are implied.
+    """
+    words = sorted({w.lower() for w in SIGNAL_KEYWORDS}, key=lambda w: (-len(w), w))
+    scanner = re.compile(r'(?=\b(' + '|'.join(re.escape(w) for w in words) + r')\b)')
+    
+    implied = {}
+    for word in words:
+        prefixes = frozenset(w for w in words
+                             if w != word and re.match(r'\b' + re.escape(w) + r'\b', word))
+        if prefixes:
+            implied[word] = prefixes
+    
+    return scanner, implied
+
+
+def extract_keywords(text: str) -> frozenset[str]:
+    """Return the signal keywords found in lowercased `text`, in one pass."""
+    scanner, implied = keyword_matcher()
+    found = set(scanner.findall(text))
+    for word in [w for w in found if w in implied]:
+        found |= implied[word]
+    return frozenset(found)
+
+
+def analyze_entry(entry: dict) -> dict:
+    """Match one entry to countries and extract its signal keywords.
+    
+    Returns an article record; 'countries' is empty when nothing matched,
+    in which case the lead and keywords are not computed.
+    """
+    title = entry.get('title', '')
+    summary = entry.get('summary', '')  # Already clean text (normalize_entry)
+    text = f"{title} {summary}".lower()
+    
+    countries = match_countries(fold_accents(text)) if text.strip() else []
+    
+    # Lead and signal keywords - once per article
+    return {
+        'title': title,
+        'url': entry.get('link', ''),
+        'source': entry.get('source', 'Unknown'),
+        'sources': entry.get('sources') or [entry.get('source', 'Unknown')],
+        'published': entry.get('published'),
+        'lead': summary[:LEAD_CHARS] if countries else '',
+        'countries': countries,
+        'keywords': extract_keywords(text) if countries else frozenset(),
+    }
+
+
+def accumulate_articles(articles: Iterable[dict]) -> dict:
+    """Collect per-country partial aggregates from analyzed article records.
+    
+    Partials from consecutive shards combine with merge_results; keywords are
+    counted in sorted order so tie-breaking doesn't depend on set ordering,
+    which differs between processes. Each article's 'sources' list is kept
+    by reference since iter_unique may still add to it while streaming.
+    """
+    results = {c: {'articles': [], 'sources': [], 'keywords': defaultdict(int),
+                   'pair_counts': defaultdict(int)}
+               for c in COUNTRIES}
+    
+    for article in articles:
+        found = sorted(article['keywords'])
+        for country in article['countries']:
+            if country not in results:
+                continue  # Country no longer configured
+            data = results[country]
+            data['articles'].append({
+                'title': article['title'],
+                'url': article['url'],
+                'source': article['source'],
+                'published': article['published'],
+                'lead': article['lead'],
+            })
+            data['sources'].append(article['sources'])
+            
+            for word in found:
+                data['keywords'][word] += 1
+            # Pairs of keywords in the same article
+            for i, w1 in enumerate(found):
+                for w2 in found[i+1:]:
+                    data['pair_counts'][(w1, w2)] += 1
+    
+    return results
+
+
+def merge_results(partials: Iterable[dict]) -> dict:
+    """Combine partial aggregates in order, as if accumulated in one pass."""
+    merged = None
+    for partial in partials:
+        if merged is None:
+            merged = partial
+            continue
+        for country, data in partial.items():
+            target = merged.setdefault(country, data)
+            if target is data:
+                continue
+            target['articles'].extend(data['articles'])
+            target['sources'].extend(data['sources'])
+            for word, count in data['keywords'].items():
+                target['keywords'][word] += count
+            for pair, count in data['pair_counts'].items():
+                target['pair_counts'][pair] += count
+    return merged if merged is not None else accumulate_articles(())
+
+
+def finalize_results(results: dict) -> dict:
+    """Turn partial aggregates into the per-country results structure."""
+    for data in results.values():
+        data['sources'] = list(dict.fromkeys(s for sources in data['sources'] for s in sources))
+        kw = sorted(data['keywords'].items(), key=lambda x: -x[1])
+        data['keywords'] = [{'word': w.capitalize(), 'count': c} for w, c in kw[:8]]
     return results
 
 
+def aggregate_articles(articles: Iterable[dict]) -> dict:
+    """Build per-country results from analyzed article records."""
+    return finalize_results(accumulate_articles(articles))
+
+
+def _init_analysis_worker():
+    # Compile the matchers once per process rather than once per shard
+    country_matcher()
+    keyword_matcher()
+
+
+def _analyze_shard(entries: list[dict]) -> dict:
+    return accumulate_articles(analyze_entry(entry) for entry in entries)
+
+
+def _analyze_chunk(entries: list[dict]) -> list[dict]:
+    return [analyze_entry(entry) for entry in entries]
+
+
+def _shards(entries: list, workers: int) -> list[list]:
+    # A few shards per worker evens out the load; contiguous shards keep
+    # the merged order identical to a single pass
+    size = max(ANALYSIS_MIN_SHARD, -(-len(entries) // (workers * 4)))
+    return [entries[i:i + size] for i in range(0, len(entries), size)]
+
+
+def analyze_entries(entries: Iterable[dict], workers: int = 1) -> Iterator[dict]:
+    """Yield analyze_entry() for each entry, in order, using `workers` processes."""
+    if workers <= 1:
+        yield from map(analyze_entry, entries)
+        return
+    shards = _shards(list(entries), workers)
+    if len(shards) <= 1:
+        yield from (analyze_entry(entry) for shard in shards for entry in shard)
+        return
+    with ProcessPoolExecutor(max_workers=min(workers, len(shards)),
+                             initializer=_init_analysis_worker) as pool:
+        for records in pool.map(_analyze_chunk, shards):
+            yield from records
+
+
+def analyze_articles(entries: Iterable[dict], workers: int = 1) -> dict:
+    """Match articles to countries, extract keywords.
+    
+    With several workers, entries are split into contiguous shards that are
+    aggregated in separate processes and merged in shard order, giving the
+    same results as a single pass. The entries are materialized first, so
+    streaming callers should stay with one worker.
+    """
+    if workers <= 1:
+        return aggregate_articles(analyze_entry(entry) for entry in entries)
+    shards = _shards(list(entries), workers)
+    if len(shards) <= 1:
+        return aggregate_articles(analyze_entry(entry) for shard in shards for entry in shard)
+    with ProcessPoolExecutor(max_workers=min(workers, len(shards)),
+                             initializer=_init_analysis_worker) as pool:
+        return finalize_results(merge_results(pool.map(_analyze_shard, shards)))
+
+
 def extract_pairs(results: dict) -> dict:
     """Find keyword co-occurrences (keywords appearing together in articles)."""
-    signal_words = set(w.lower() for w in SIGNAL_KEYWORDS)
     pairs = {}
     
     for country, data in results.items():
-        pair_counts = defaultdict(int)
-        
-        for article in data['articles']:
-            text = f"{article['title']} {article.get('lead', '')}".lower()
-            # Use word boundaries for accurate matching
-            found = sorted(w for w in signal_words if re.search(r'\b' + re.escape(w) + r'\b', text))
-            
-            # Generate pairs from keywords in same article
-            for i, w1 in enumerate(found):
-                for w2 in found[i+1:]:
-                    pair_counts[(w1, w2)] += 1
-        
         # Keep pairs appearing in 2+ articles
         pairs[country] = [
             [p[0].capitalize(), p[1].capitalize()]
-            for p, c in sorted(pair_counts.items(), key=lambda x: -x[1])[:6]
+            for p, c in sorted(data['pair_counts'].items(), key=lambda x: -x[1])[:6]
             if c >= 2
         ]
     
     return pairs
 
 
-def load_history() -> dict:
-    if HISTORY_FILE.exists():
-        with open(HISTORY_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return {'days': []}
+def _history_header(names: list[str]) -> bytes:
+    blob = json.dumps(names, ensure_ascii=False).encode('utf-8')
+    return HISTORY_MAGIC + struct.pack('<HHI', HISTORY_VERSION, len(names), len(blob)) + blob
+
+
+def _read_history_header(f) -> tuple[list[str], int, int]:
+    """Return (column names, offset of first record, record size)."""
+    magic = f.read(4)
+    if magic != HISTORY_MAGIC:
+        raise ValueError(f"{HISTORY_BIN} is not a history file")
+    version, count, length = struct.unpack('<HHI', f.read(8))
+    if version != HISTORY_VERSION:
+        raise ValueError(f"Unsupported history version {version}")
+    names = json.loads(f.read(length).decode('utf-8'))
+    return names, 12 + length, 4 * (count + 1)
+
+
+def _pack_day(day: dict, names: list[str]) -> bytes:
+    ordinal = datetime.strptime(day['date'], '%Y-%m-%d').toordinal()
+    counts = day.get('counts', {})
+    return struct.pack(f'<{len(names) + 1}i', ordinal,
+                       *(int(counts.get(name, HISTORY_MISSING)) for name in names))
+
+
+def _read_history_records(days: int | None = None) -> tuple[list[str], np.ndarray]:
+    """Read the trailing `days` records as an int32 array of shape (days, 1 + columns)."""
+    if not HISTORY_BIN.exists():
+        migrate_history()
+        if not HISTORY_BIN.exists():
+            return list(COUNTRIES), np.empty((0, len(COUNTRIES) + 1), dtype='<i4')
+    
+    with open(HISTORY_BIN, 'rb') as f:
+        names, offset, record_size = _read_history_header(f)
+        total = (f.seek(0, 2) - offset) // record_size
+        count = total if days is None else min(days, total)
+        f.seek(offset + (total - count) * record_size)
+        records = np.frombuffer(f.read(count * record_size), dtype='<i4')
+    
+    return names, records.reshape(count, len(names) + 1)
+
+
+def load_history(days: int | None = None) -> dict:
+    """Load the trailing `days` of history (all of it when None).
+    
+    Only the requested records are read from disk, so the cost does not
+    grow with the length of the history.
+    """
+    names, records = _read_history_records(days)
+    history = {'days': []}
+    for row in records.tolist():
+        history['days'].append({
+            'date': datetime.fromordinal(row[0]).strftime('%Y-%m-%d'),
+            'counts': {name: v for name, v in zip(names, row[1:]) if v != HISTORY_MISSING},
+        })
+    return history
+
+
+def load_history_matrix(days: int | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """Load history as (date ordinals, counts) with counts shaped countries x days.
+    
+    Rows follow COUNTRIES order; untracked values are NaN.
+    """
+    names, records = _read_history_records(days)
+    counts = np.full((len(COUNTRIES), len(records)), np.nan)
+    column = {name: i for i, name in enumerate(names)}
+    
+    for row, country in enumerate(COUNTRIES):
+        if country in column:
+            values = records[:, column[country] + 1].astype(float)
+            values[values == HISTORY_MISSING] = np.nan
+            counts[row] = values
+    
+    return records[:, 0].astype(np.int64), counts
 
 
 def save_history(history: dict):
+    """Rewrite the whole history file, with one column per country in COUNTRIES."""
     DATA_DIR.mkdir(exist_ok=True)
+    names = list(COUNTRIES)
+    days = sorted(history.get('days', []), key=lambda d: d['date'])
+    
+    tmp = HISTORY_BIN.with_suffix('.tmp')
+    with open(tmp, 'wb') as f:
+        f.write(_history_header(names))
+        for day in days:
+            f.write(_pack_day(day, names))
+    tmp.replace(HISTORY_BIN)
+
+
+def append_history(counts: dict, date: str | None = None):
+    """Record one day's counts.
+    
+    Appends a record, or overwrites the last one when it is for the same day
+    (there are several runs per day). Falls back to a full rewrite only if
+    the countries changed or the date is out of order.
+    """
+    day = {'date': date or datetime.now().strftime('%Y-%m-%d'), 'counts': counts}
+    names = list(COUNTRIES)
+    
+    if not HISTORY_BIN.exists():
+        migrate_history()
+    
+    if HISTORY_BIN.exists():
+        with open(HISTORY_BIN, 'r+b') as f:
+            columns, offset, record_size = _read_history_header(f)
+            end = f.seek(0, 2)
+            
+            last = None
+            if end > offset:
+                f.seek(end - record_size)
+                last = struct.unpack('<i', f.read(4))[0]
+            
+            record = _pack_day(day, names)
+            ordinal = struct.unpack('<i', record[:4])[0]
+            if columns == names and (last is None or ordinal >= last):
+                f.seek(end - record_size if ordinal == last else end)
+                f.write(record)
+                return
+    
+    history = load_history()
+    history['days'] = [d for d in history['days'] if d['date'] != day['date']] + [day]
+    save_history(history)
+
+
+def migrate_history():
+    """One-time conversion of the legacy data/history.json into data/history.bin."""
+    if not HISTORY_FILE.exists():
+        return
+    with open(HISTORY_FILE, 'r', encoding='utf-8') as f:
+        history = json.load(f)
+    save_history(history)
+    print(f"   Migrated {len(history.get('days', []))} days from {HISTORY_FILE} to {HISTORY_BIN}")
+
+
+def export_history_json(days: int = HISTORY_EXPORT_DAYS):
+    """Write the trailing window of history as JSON for the dashboard."""
+    history = load_history(days)
     with open(HISTORY_FILE, 'w', encoding='utf-8') as f:
-        json.dump(history, f, indent=2)
+        json.dump(history, f, ensure_ascii=False, separators=(',', ':'))
 
 
-def update_history(history: dict, counts: dict) -> dict:
-    today = datetime.now().strftime('%Y-%m-%d')
-    history['days'] = [d for d in history['days'] if d['date'] != today]
-    history['days'].append({'date': today, 'counts': counts})
-    history['days'] = sorted(history['days'], key=lambda x: x['date'])
-    return history
+def history_matrix(history: dict) -> tuple[np.ndarray, np.ndarray]:
+    """Convert a history dict into (date ordinals, countries x days counts)."""
+    days = history.get('days', [])
+    dates = np.array([datetime.strptime(d['date'], '%Y-%m-%d').toordinal() for d in days],
+                     dtype=np.int64)
+    counts = np.array([[d.get('counts', {}).get(c, np.nan) for d in days] for c in COUNTRIES],
+                      dtype=float).reshape(len(COUNTRIES), len(days))
+    return dates, counts
 
 
-def calculate_baselines(history: dict) -> dict:
-    """Get baseline from last 30 days of history or use defaults."""
-    baselines = {}
+def rolling_baselines(dates: np.ndarray, counts: np.ndarray, method: str = 'mean',
+                      window: int = BASELINE_DAYS, today: int | None = None) -> np.ndarray:
+    """Baseline for every country and day from the `window` records before it.
     
-    # Use only last 30 days for baseline calculation
-    recent_days = history.get('days', [])[-30:]
+    Computed for all countries and days at once. Returns an array shaped
+    countries x (days + 1): column t is the baseline for record t, and the
+    last column is the baseline for today's run. NaN where fewer than
+    MIN_BASELINE_DAYS values are available.
+    
+    Methods: 'mean' (the default policy), 'median', 'ewma' (exponentially
+    weighted, span = window) and 'dow' (mean scaled by the ratio of the
+    target weekday's mean to the overall mean).
+    """
+    n_countries, n_days = counts.shape
+    padded = np.concatenate([np.full((n_countries, window), np.nan), counts], axis=1)
+    windows = sliding_window_view(padded, window, axis=1)  # (countries, days + 1, window)
+    valid = ~np.isnan(windows)
+    values = np.where(valid, windows, 0.0)
+    n_valid = valid.sum(axis=2)
     
-    for country, info in COUNTRIES.items():
-        counts = [d['counts'].get(country, 0) for d in recent_days 
-                  if country in d.get('counts', {})]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = values.sum(axis=2) / n_valid
         
-        if len(counts) >= 3:
-            baselines[country] = max(sum(counts) / len(counts), 0.5)
+        if method == 'mean':
+            baselines = mean
+        elif method == 'median':
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)  # All-NaN windows
+                baselines = np.nanmedian(windows, axis=2)
+        elif method == 'ewma':
+            alpha = 2 / (window + 1)
+            weights = (1 - alpha) ** np.arange(window - 1, -1, -1)
+            baselines = (values * weights).sum(axis=2) / (valid * weights).sum(axis=2)
+        elif method == 'dow':
+            if today is None:
+                today = datetime.now().toordinal()
+            padded_dates = np.concatenate([np.full(window, -1), dates, [today]])
+            weekdays = padded_dates % 7
+            day_windows = sliding_window_view(padded_dates[:-1], window)
+            same_day = (day_windows >= 0) & (day_windows % 7 == weekdays[window:, None])
+            day_valid = valid & same_day
+            day_mean = (values * same_day).sum(axis=2) / day_valid.sum(axis=2)
+            factor = np.where(np.isfinite(day_mean / mean), day_mean / mean, 1.0)
+            baselines = mean * factor
+        else:
+            raise ValueError(f"Unknown baseline method: {method}")
+    
+    baselines[n_valid < MIN_BASELINE_DAYS] = np.nan
+    return baselines
+
+
+def rolling_mad(counts: np.ndarray, window: int = BASELINE_DAYS) -> np.ndarray:
+    """Median absolute deviation over the same windows as rolling_baselines."""
+    padded = np.concatenate([np.full((counts.shape[0], window), np.nan), counts], axis=1)
+    windows = sliding_window_view(padded, window, axis=1)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        median = np.nanmedian(windows, axis=2)
+        return np.nanmedian(np.abs(windows - median[..., None]), axis=2)
+
+
+def calculate_baselines(history: dict, method: str = BASELINE_METHOD) -> dict:
+    """Get baseline from last 30 days of history or use defaults."""
+    # Use only last 30 days for baseline calculation
+    recent = {'days': history.get('days', [])[-BASELINE_DAYS:]}
+    dates, counts = history_matrix(recent)
+    return baseline_dict(rolling_baselines(dates, counts, method)[:, -1])
+
+
+def baseline_dict(column: np.ndarray) -> dict:
+    """Map one column of rolling_baselines to countries, applying defaults and the floor."""
+    baselines = {}
+    for country, value in zip(COUNTRIES, column):
+        if np.isnan(value):
+            baselines[country] = COUNTRIES[country]['baseline']
         else:
-            baselines[country] = info['baseline']
+            baselines[country] = max(float(value), 0.5)
     
     return baselines
 
 
+def ratio_statuses(counts: np.ndarray, baselines: np.ndarray) -> np.ndarray:
+    """Vectorized article/ratio tiers of score_countries.
+    
+    History has no per-source counts, so the source-diversity rules cannot
+    be applied: 'high' here is ratio >= 2.5 regardless of sources (an upper
+    bound on what score_countries would report). Missing counts are ''.
+    """
+    defaults = np.array([info['baseline'] for info in COUNTRIES.values()])[:, None]
+    base = np.where(np.isnan(baselines), defaults, np.maximum(baselines, 0.5))
+    ratio = counts / base
+    
+    return np.select(
+        [np.isnan(counts), counts == 0, counts < 2, ratio >= 2.5, ratio >= 1.5],
+        ['', 'quiet', 'normal', 'high', 'elevated'],
+        'normal',
+    )
+
+
+def mad_statuses(counts: np.ndarray, median: np.ndarray, mad: np.ndarray) -> np.ndarray:
+    """Vectorized tiers by robust z-score, (count - median) / (1.4826 * MAD).
+    
+    'high' and 'elevated' are z >= MAD_HIGH_Z and MAD_ELEVATED_Z; the
+    quiet/normal floor is the same as ratio_statuses. The scale is at least
+    MAD_MIN_SCALE, so a flat history does not make every extra article a
+    spike. Where the window is too short for a median, ratio_statuses with
+    the default baseline is used.
+    """
+    scale = np.maximum(1.4826 * np.nan_to_num(mad), MAD_MIN_SCALE)
+    z = (counts - median) / scale
+    statuses = np.select(
+        [np.isnan(counts), counts == 0, counts < 2, z >= MAD_HIGH_Z, z >= MAD_ELEVATED_Z],
+        ['', 'quiet', 'normal', 'high', 'elevated'],
+        'normal',
+    )
+    return np.where(np.isnan(median), ratio_statuses(counts, median), statuses)
+
+
+def backtest(methods: Iterable[str] = (*BASELINE_METHODS, 'mad')) -> dict:
+    """Score the whole history with each baseline method.
+    
+    'mad' tiers each day by robust z-score against the median and MAD of
+    its window (mad_statuses); the other methods use the ratio tiers.
+    Returns {method: {'high': n, 'elevated': n, 'normal': n, 'quiet': n, 'ms': t}}
+    counting country-days in each tier.
+    """
+    dates, counts = load_history_matrix()
+    report = {}
+    
+    for method in methods:
+        start = time.perf_counter()
+        if method == 'mad':
+            median = rolling_baselines(dates, counts, 'median')[:, :-1]
+            statuses = mad_statuses(counts, median, rolling_mad(counts)[:, :-1])
+        else:
+            baselines = rolling_baselines(dates, counts, method)[:, :-1]
+            statuses = ratio_statuses(counts, baselines)
+        elapsed = (time.perf_counter() - start) * 1000
+        
+        report[method] = {s: int((statuses == s).sum()) for s in ('high', 'elevated', 'normal', 'quiet')}
+        report[method]['ms'] = round(elapsed, 1)
+    
+    return report
+
+
 def score_countries(results: dict, baselines: dict, pairs: dict) -> dict:
     """Calculate anomaly scores with confidence."""
     scores = {}
@@ -433,15 +1524,1193 @@ def generate_output(results: dict, scores: dict, pairs: dict, timestamp: str) ->
     }
 
 
+def shard_name(country: str) -> str:
+    """File name of a country's shard, e.g. 'cote-d-ivoire.json'."""
+    ascii_name = unicodedata.normalize('NFKD', country).encode('ascii', 'ignore').decode('ascii')
+    return re.sub(r'[^a-z0-9]+', '-', ascii_name.lower()).strip('-') + '.json'
+
+
+def write_compressed(path: Path, data: bytes):
+    """Write `data` to `path` with precompressed .gz (and, with brotli, .br) siblings."""
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_bytes(data)
+    tmp.replace(path)
+    # mtime=0 keeps the gzip bytes identical for identical content
+    path.with_name(path.name + '.gz').write_bytes(gzip.compress(data, 9, mtime=0))
+    if brotli is not None:
+        path.with_name(path.name + '.br').write_bytes(brotli.compress(data))
+
+
+def write_output(output: dict) -> int:
+    """Write generate_output() as data/index.json plus one shard per country.
+    
+    The index holds the summary and each country's scores, with the name
+    and content hash of its shard; the shard holds SHARD_FIELDS. Shards
+    whose hash matches the previous index are not rewritten. Returns the
+    number of shards written.
+    """
+    previous = {}
+    if INDEX_FILE.exists():
+        try:
+            with open(INDEX_FILE, 'r', encoding='utf-8') as f:
+                previous = {c: d.get('hash') for c, d in json.load(f)['countries'].items()}
+        except (ValueError, KeyError):
+            pass  # Unreadable index: rewrite every shard
+    
+    SHARD_DIR.mkdir(parents=True, exist_ok=True)
+    countries = {}
+    written = 0
+    
+    for country, data in output['countries'].items():
+        blob = json.dumps({k: data[k] for k in SHARD_FIELDS},
+                          ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        digest = hashlib.sha256(blob).hexdigest()[:16]
+        name = shard_name(country)
+        if previous.get(country) != digest or not (SHARD_DIR / name).exists():
+            write_compressed(SHARD_DIR / name, blob)
+            written += 1
+        countries[country] = {
+            **{k: v for k, v in data.items() if k not in SHARD_FIELDS},
+            'shard': f"{SHARD_DIR.name}/{name}",
+            'hash': digest,
+        }
+    
+    index = {**output, 'countries': countries}
+    write_compressed(INDEX_FILE, json.dumps(index, ensure_ascii=False,
+                                            separators=(',', ':')).encode('utf-8'))
+    return written
+
+
+def publish(results: dict, scores: dict, pairs: dict, series: 'HourlySeries | None' = None) -> int:
+    """Record counts in the daily history and hourly series, then write the
+    index and changed shards.
+    
+    `series` is updated in place when given, or loaded from data/hourly.bin.
+    Returns the number of country shards written.
+    """
+    append_history({c: len(d['articles']) for c, d in results.items()})
+    export_history_json()
+    
+    series = series or HourlySeries.load()
+    record_hourly(series, results)
+    series.save()
+    
+    DATA_DIR.mkdir(exist_ok=True)
+    return write_output(generate_output(results, scores, pairs,
+                                        datetime.now(timezone.utc).isoformat(timespec='seconds')))
+
+
+# =============================================================================
+# HOURLY SERIES
+# =============================================================================
+
+def epoch_hour(timestamp: float | None = None) -> int:
+    """Hours since the Unix epoch of epoch seconds (default now)."""
+    return int(time.time() if timestamp is None else timestamp) // 3600
+
+
+class HourlySeries:
+    """Per-country article counts by publication hour, in a ring buffer.
+    
+    One preallocated int32 array of countries x (HOURLY_DAYS * 24) slots;
+    hour h (hours since the epoch) lives in slot h % slots, so updating a
+    bucket is O(1) and the series never grows. Slots never recorded, or
+    recycled since, hold HISTORY_MISSING. Stored in data/hourly.bin as a
+    short header followed by the raw array.
+    """
+    
+    def __init__(self, names: Iterable[str] = COUNTRIES, days: int = HOURLY_DAYS):
+        self.names = list(names)
+        self.counts = np.full((len(self.names), days * 24), HISTORY_MISSING, dtype=np.int32)
+        self.latest = None  # Newest hour recorded
+    
+    @property
+    def slots(self) -> int:
+        return self.counts.shape[1]
+    
+    @classmethod
+    def load(cls, path: Path = HOURLY_BIN) -> 'HourlySeries':
+        """Read the series, remapped to the current COUNTRIES (empty if there is no file)."""
+        series = cls()
+        if not path.exists():
+            return series
+        
+        with open(path, 'rb') as f:
+            if f.read(4) != HOURLY_MAGIC:
+                raise ValueError(f"{path} is not an hourly series file")
+            version, count, slots, latest, length = struct.unpack('<HHIqI', f.read(20))
+            if version != HOURLY_VERSION:
+                raise ValueError(f"Unsupported hourly series version {version}")
+            names = json.loads(f.read(length).decode('utf-8'))
+            counts = np.fromfile(f, dtype='<i4', count=count * slots).reshape(count, slots)
+        
+        if latest < 0:
+            return series
+        series.latest = latest
+        hours = np.arange(latest - min(slots, series.slots) + 1, latest + 1)
+        rows = {name: i for i, name in enumerate(names)}
+        for row, name in enumerate(series.names):
+            if name in rows:
+                series.counts[row, hours % series.slots] = counts[rows[name], hours % slots]
+        return series
+    
+    def save(self, path: Path = HOURLY_BIN):
+        blob = json.dumps(self.names, ensure_ascii=False).encode('utf-8')
+        header = HOURLY_MAGIC + struct.pack('<HHIqI', HOURLY_VERSION, len(self.names), self.slots,
+                                            -1 if self.latest is None else self.latest, len(blob))
+        path.parent.mkdir(exist_ok=True)
+        tmp = path.with_name(path.name + '.tmp')
+        with open(tmp, 'wb') as f:
+            f.write(header + blob)
+            f.write(self.counts.astype('<i4').tobytes())
+        tmp.replace(path)
+    
+    def advance(self, hour: int):
+        """Make `hour` the newest hour, marking the slots skipped over as missing."""
+        if self.latest is not None and hour <= self.latest:
+            return
+        if self.latest is None or hour - self.latest >= self.slots:
+            self.counts.fill(HISTORY_MISSING)
+        else:
+            self.counts[:, np.arange(self.latest + 1, hour + 1) % self.slots] = HISTORY_MISSING
+        self.latest = hour
+    
+    def record(self, hour: int, counts: np.ndarray):
+        """Set every country's count for one hour (ignored if it fell out of the ring)."""
+        self.advance(hour)
+        if hour > self.latest - self.slots:
+            self.counts[:, hour % self.slots] = counts
+    
+    def window(self, end: int, hours: int) -> np.ndarray:
+        """Counts for the `hours` hours up to and including `end`, oldest first."""
+        span = np.arange(end - hours + 1, end + 1)
+        out = np.full((len(self.names), hours), HISTORY_MISSING, dtype=np.int32)
+        if self.latest is not None:
+            held = (span > self.latest - self.slots) & (span <= self.latest)
+            out[:, held] = self.counts[:, span[held] % self.slots]
+        return out
+    
+    def window_baselines(self, end: int, hours: int = 24, days: int = BASELINE_DAYS) -> np.ndarray:
+        """Mean count over the same `hours`-hour window on each of the previous days.
+        
+        The window ending at `end` is compared with those ending 24h, 48h,
+        ... earlier. Only windows with no missing hour are used; NaN where
+        fewer than MIN_BASELINE_DAYS are complete.
+        """
+        # Every earlier window lies in one span, summed with cumulative sums
+        values = self.window(end - 24, days * 24 + hours - 24)
+        missing = values == HISTORY_MISSING
+        zero = np.zeros((len(self.names), 1), dtype=np.int64)
+        sums = np.concatenate([zero, np.cumsum(np.where(missing, 0, values), axis=1)], axis=1)
+        gaps = np.concatenate([zero, np.cumsum(missing, axis=1)], axis=1)
+        
+        ends = values.shape[1] - 24 * np.arange(days)
+        totals = sums[:, ends] - sums[:, ends - hours]
+        complete = (gaps[:, ends] - gaps[:, ends - hours]) == 0
+        n = complete.sum(axis=1)
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(complete, totals, 0).sum(axis=1) / n
+        return np.where(n >= MIN_BASELINE_DAYS, mean, np.nan)
+    
+    def hour_of_day(self, end: int, days: int = BASELINE_DAYS) -> np.ndarray:
+        """Mean count for each hour of the day (UTC) over the `days` days up to `end`.
+        
+        Returns countries x 24, column h for hour h; NaN where never recorded.
+        """
+        values = self.window(end, days * 24).astype(float)
+        values[values == HISTORY_MISSING] = np.nan
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)  # Hours with no data at all
+            profile = np.nanmean(values.reshape(len(self.names), days, 24), axis=1)
+        # Column j of the reshaped window is hour (end - days * 24 + 1 + j) % 24
+        return np.roll(profile, (end + 1) % 24, axis=1)
+    
+    def baselines(self, end: int) -> dict:
+        """Same-window 24h baselines for the countries with enough complete days."""
+        return {country: max(float(value), 0.5)
+                for country, value in zip(self.names, self.window_baselines(end))
+                if not np.isnan(value)}
+
+
+def hourly_counts(results: dict, now: float | None = None) -> tuple[int, np.ndarray]:
+    """Articles per country for each hour of the 24h window, by published hour.
+    
+    Returns (last hour, countries x 24 counts, oldest first). Undated
+    articles count in the last hour.
+    """
+    end = epoch_hour(now)
+    counts = np.zeros((len(COUNTRIES), 24), dtype=np.int32)
+    
+    for row, country in enumerate(COUNTRIES):
+        for article in results.get(country, {}).get('articles', []):
+            published = article.get('published')
+            hour = end if published is None else min(published // 3600, end)
+            if hour > end - 24:
+                counts[row, hour - end + 23] += 1
+    
+    return end, counts
+
+
+def record_hourly(series: HourlySeries, results: dict, now: float | None = None):
+    """Overwrite the last 24 hourly buckets with this run's window.
+    
+    Each run sees every article of the window, so the buckets are set
+    rather than added to; older hours keep their last recorded counts.
+    """
+    end, counts = hourly_counts(results, now)
+    for i in range(24):
+        series.record(end - 23 + i, counts[:, i])
+
+
+# =============================================================================
+# ARTICLE STORE
+# =============================================================================
+
+def open_store(path: Path = ARTICLE_DB) -> sqlite3.Connection:
+    """Open (creating if needed) the persistent article store.
+    
+    Articles are keyed by title_key(), so an article already classified in
+    an earlier run is never matched again. The title keys of its other
+    near-duplicates (article_keys) and the LSH bands of its MinHash
+    signature (article_bands) are kept too, so a rewrite arriving in a
+    later run joins it instead of counting as a second article.
+    """
+    path.parent.mkdir(exist_ok=True)
+    conn = sqlite3.connect(path)
+    columns = {row[1]: row[2] for row in conn.execute("PRAGMA table_info(articles)")}
+    if columns and 'sources' not in columns:
+        conn.execute("ALTER TABLE articles ADD COLUMN sources TEXT")
+    if columns and 'signature' not in columns:
+        conn.execute("ALTER TABLE articles ADD COLUMN signature BLOB")
+    if columns.get('seen_at') == 'TEXT':
+        # Stores from before epoch times held ISO strings; rebuild with the new column types
+        conn.execute("ALTER TABLE articles RENAME TO articles_iso")
+        conn.execute("DROP INDEX IF EXISTS articles_seen_at")
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS articles (
+            id TEXT PRIMARY KEY,
+            title TEXT NOT NULL,
+            url TEXT,
+            source TEXT,
+            published INTEGER,
+            seen_at INTEGER NOT NULL,
+            lead TEXT,
+            countries TEXT NOT NULL,
+            keywords TEXT NOT NULL,
+            sources TEXT,
+            signature BLOB
+        );
+        CREATE INDEX IF NOT EXISTS articles_seen_at ON articles (seen_at);
+        CREATE TABLE IF NOT EXISTS article_keys (
+            key TEXT PRIMARY KEY,
+            id TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS article_bands (
+            band BLOB NOT NULL,
+            id TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS article_bands_band ON article_bands (band);
+    """)
+    if columns.get('seen_at') == 'TEXT':
+        rows = conn.execute("SELECT id, title, url, source, published, seen_at, lead, countries, "
+                            "keywords, sources, signature FROM articles_iso").fetchall()
+        conn.executemany(
+            "INSERT INTO articles (id, title, url, source, published, seen_at, lead, countries, "
+            "keywords, sources, signature) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(*row[:4], to_epoch(row[4]), to_epoch(row[5]) or 0, *row[6:]) for row in rows],
+        )
+        conn.execute("DROP TABLE articles_iso")
+        conn.commit()
+    return conn
+
+
+def stored_duplicate(conn: sqlite3.Connection, entry: dict, key: str,
+                     threshold: float = NEAR_DUPLICATE_JACCARD) -> str | None:
+    """Id of the stored article that `entry` (from iter_unique) duplicates, if any.
+    
+    Any title key of the entry's cluster may match a stored article or one
+    of its near-duplicates. Failing that, stored articles sharing an LSH
+    band are compared by MinHash signature, as within a run.
+    """
+    keys = entry.get('_keys') or [key]
+    marks = ', '.join('?' * len(keys))
+    row = conn.execute(f"SELECT id FROM articles WHERE id IN ({marks}) UNION ALL "
+                       f"SELECT id FROM article_keys WHERE key IN ({marks}) LIMIT 1",
+                       (*keys, *keys)).fetchone()
+    if row:
+        return row[0]
+    
+    signature = entry.get('_signature')
+    if signature is None:
+        return None
+    bands = lsh_bands(signature)
+    rows = conn.execute(
+        f"SELECT DISTINCT articles.id, articles.signature FROM article_bands "
+        f"JOIN articles ON articles.id = article_bands.id "
+        f"WHERE article_bands.band IN ({', '.join('?' * len(bands))}) LIMIT ?",
+        (*bands, LSH_MAX_CANDIDATES * LSH_BANDS))
+    for candidate, stored in rows:
+        if stored and (np.count_nonzero(np.frombuffer(stored, dtype=np.uint32) == signature)
+                       >= threshold * MINHASH_PERMUTATIONS):
+            return candidate
+    return None
+
+
+def store_articles(conn: sqlite3.Connection, entries: Iterable[dict],
+                   retention_days: int = STORE_RETENTION_DAYS, workers: int = 1) -> int:
+    """Analyze and insert entries not already in the store. Returns the number added.
+    
+    'seen_at' is the published time in epoch seconds, or the time first
+    seen for undated entries. Entries older than the retention period are
+    skipped unanalyzed.
+    For articles already stored, including near-duplicates of them (see
+    stored_duplicate), new sources from their duplicate cluster are merged
+    in. New entries are analyzed with `workers` processes.
+    """
+    first_seen = int(time.time())
+    retention_cutoff = first_seen - retention_days * 86400
+    pending = {}  # key -> (seen_at, sources, entry), analyzed once the input is consumed
+    
+    for entry in entries:
+        key = title_key(entry.get('title', ''))
+        if key is None:
+            continue
+        
+        seen_at = entry.get('published') or first_seen
+        if seen_at < retention_cutoff:
+            continue
+        sources = entry.get('sources') or [entry.get('source', 'Unknown')]
+        
+        stored = stored_duplicate(conn, entry, key)
+        if stored:
+            row = conn.execute("SELECT source, sources FROM articles WHERE id = ?", (stored,)).fetchone()
+            known = json.loads(row[1]) if row[1] else [row[0]]
+            merged = known + [s for s in sources if s not in known]
+            if merged != known:
+                conn.execute("UPDATE articles SET sources = ? WHERE id = ?",
+                             (json.dumps(merged, ensure_ascii=False), stored))
+            conn.executemany("INSERT OR IGNORE INTO article_keys (key, id) VALUES (?, ?)",
+                             [(k, stored) for k in entry.get('_keys') or [key] if k != stored])
+            continue
+        if key in pending:
+            known = pending[key][1]
+            known.extend(s for s in sources if s not in known)
+            continue
+        pending[key] = (seen_at, list(sources), entry)
+    
+    articles = analyze_entries((entry for _, _, entry in pending.values()), workers)
+    for (key, (seen_at, sources, entry)), article in zip(pending.items(), articles):
+        signature = entry.get('_signature')
+        conn.execute(
+            "INSERT INTO articles (id, title, url, source, published, seen_at, lead, countries, "
+            "keywords, sources, signature) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (key, article['title'], article['url'], article['source'], article['published'],
+             seen_at, article['lead'], json.dumps(article['countries'], ensure_ascii=False),
+             json.dumps(sorted(article['keywords']), ensure_ascii=False),
+             json.dumps(sources, ensure_ascii=False),
+             signature.tobytes() if signature is not None else None),
+        )
+        conn.executemany("INSERT OR IGNORE INTO article_keys (key, id) VALUES (?, ?)",
+                         [(k, key) for k in entry.get('_keys', []) if k != key])
+        if signature is not None:
+            conn.executemany("INSERT INTO article_bands (band, id) VALUES (?, ?)",
+                             [(band, key) for band in lsh_bands(signature)])
+    
+    conn.commit()
+    return len(pending)
+
+
+def load_window(conn: sqlite3.Connection, hours: int = 24) -> list[dict]:
+    """Return stored article records from the last N hours, newest first."""
+    cutoff = int(time.time()) - hours * 3600
+    rows = conn.execute(
+        "SELECT title, url, source, sources, published, lead, countries, keywords FROM articles "
+        "WHERE seen_at >= ? AND countries != '[]' ORDER BY seen_at DESC",
+        (cutoff,),
+    )
+    return [{
+        'title': title,
+        'url': url,
+        'source': source,
+        'sources': json.loads(sources) if sources else [source],
+        'published': published,
+        'lead': lead,
+        'countries': json.loads(countries),
+        'keywords': frozenset(json.loads(keywords)),
+    } for title, url, source, sources, published, lead, countries, keywords in rows]
+
+
+def evict_articles(conn: sqlite3.Connection, retention_days: int = STORE_RETENTION_DAYS) -> int:
+    """Delete articles older than the retention period. Returns the number removed."""
+    cutoff = int(time.time()) - retention_days * 86400
+    removed = conn.execute("DELETE FROM articles WHERE seen_at < ?", (cutoff,)).rowcount
+    if removed:
+        conn.execute("DELETE FROM article_keys WHERE id NOT IN (SELECT id FROM articles)")
+        conn.execute("DELETE FROM article_bands WHERE id NOT IN (SELECT id FROM articles)")
+    conn.commit()
+    return removed
+
+
+# =============================================================================
+# ARCHIVE & REPLAY
+# =============================================================================
+
+def entry_id(entry: dict) -> str:
+    """Content hash identifying a raw entry across runs."""
+    raw = json.dumps([entry.get(k) for k in ('source', 'title', 'link', 'summary', 'published')],
+                     ensure_ascii=False)
+    return hashlib.md5(raw.encode('utf-8')).hexdigest()
+
+
+def read_archive(path: Path) -> tuple[dict, list[dict]]:
+    """Read one day's archive into (entries by id, runs in order)."""
+    entries = {}
+    runs = []
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            record = json.loads(line)
+            if 'id' in record:
+                # Archives written before normalization hold raw HTML and ISO dates
+                entries[record.pop('id')] = normalize_entry(record)
+            else:
+                runs.append(record)
+    return entries, runs
+
+
+class RunArchive:
+    """Appends one run's raw entries to data/archive/YYYY-MM-DD.jsonl.gz.
+    
+    Each day file is a series of gzip members, one per run, so runs are
+    appended without rewriting. An entry is stored once per day
+    ({"id": ..., **entry}); each run ends with a record listing the entry
+    ids it saw, in order, and the statuses it published.
+    """
+    
+    def __init__(self, run_at: datetime | None = None):
+        self.run_at = run_at or datetime.now()
+        self.path = ARCHIVE_DIR / f"{self.run_at:%Y-%m-%d}.jsonl.gz"
+        self.ids = []
+        self.known = set(read_archive(self.path)[0]) if self.path.exists() else set()
+        ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
+        self.file = gzip.open(self.path, 'at', encoding='utf-8')
+    
+    def tee(self, entries: Iterable[dict]) -> Iterator[dict]:
+        """Archive entries as they pass through."""
+        for entry in entries:
+            key = entry_id(entry)
+            if key not in self.known:
+                self.known.add(key)
+                self.file.write(json.dumps({'id': key, **entry}, ensure_ascii=False) + '\n')
+            self.ids.append(key)
+            yield entry
+    
+    def close(self, scores: dict, baselines: dict | None = None):
+        """Write the run record with the published statuses and the baselines scored against."""
+        record = {
+            'run_at': self.run_at.isoformat(timespec='seconds'),
+            'ids': self.ids,
+            'statuses': {c: s['status'] for c, s in scores.items()},
+        }
+        if baselines is not None:
+            record['baselines'] = baselines
+        self.file.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self.file.close()
+
+
+# Analysis of archived entries, reused across the runs and days a worker replays
+# (without the cluster sources, which change from run to run)
+_replay_memo = {}
+
+
+def replay_day(path: Path, baselines: dict, recompute: bool = False) -> dict:
+    """Re-score every archived run of one day and diff against what was published.
+    
+    Each run is scored with the baselines it recorded, or with `baselines`
+    when `recompute` is set or the run recorded none.
+    """
+    entries, runs = read_archive(path)
+    if len(_replay_memo) > 500_000:
+        _replay_memo.clear()
+    
+    report = {'date': path.name[:10], 'runs': len(runs), 'changed_runs': 0, 'changes': {}}
+    
+    for run in runs:
+        run_at = datetime.fromisoformat(run['run_at']).timestamp()
+        raw = [entries[i] | {'_id': i} for i in run['ids'] if i in entries]
+        
+        recent = filter_recent(deduplicate(raw), now=run_at)
+        for entry in recent:
+            if entry['_id'] not in _replay_memo:
+                _replay_memo[entry['_id']] = analyze_entry(entry)
+        
+        # The memo is shared across runs; sources are this run's cluster
+        results = aggregate_articles({**_replay_memo[entry['_id']], 'sources': entry['sources']}
+                                     for entry in recent)
+        pairs = extract_pairs(results)
+        used = baselines if recompute or 'baselines' not in run else run['baselines']
+        scores = score_countries(results, used, pairs)
+        
+        changes = {c: [run['statuses'].get(c, 'quiet'), s['status']]
+                   for c, s in scores.items() if s['status'] != run['statuses'].get(c, 'quiet')}
+        if changes:
+            report['changed_runs'] += 1
+        report['changes'] = changes  # Last run of the day is what stayed published
+    
+    return report
+
+
+def _replay_chunk(jobs: list[tuple[Path, dict, bool]]) -> list[dict]:
+    return [replay_day(path, baselines, recompute) for path, baselines, recompute in jobs]
+
+
+def replay(start: str, end: str, workers: int | None = None, recompute: bool = False) -> list[dict]:
+    """Replay archived runs between two YYYY-MM-DD dates (inclusive).
+    
+    Days are split into contiguous chunks across worker processes so each
+    worker reuses the analysis of entries that persist from day to day.
+    Runs are scored with the baselines they were published with, so that
+    only changes to matching and scoring show up. With `recompute` (and for
+    runs archived without baselines) they come from the history recorded
+    before each day instead.
+    """
+    paths = sorted(p for p in ARCHIVE_DIR.glob('*.jsonl.gz') if start <= p.name[:10] <= end)
+    if not paths:
+        return []
+    
+    dates, counts = load_history_matrix()
+    columns = rolling_baselines(dates, counts)
+    jobs = []
+    for path in paths:
+        ordinal = datetime.strptime(path.name[:10], '%Y-%m-%d').toordinal()
+        jobs.append((path, baseline_dict(columns[:, np.searchsorted(dates, ordinal)]), recompute))
+    
+    workers = workers or os.cpu_count() or 1
+    size = -(-len(jobs) // workers)
+    chunks = [jobs[i:i + size] for i in range(0, len(jobs), size)]
+    
+    with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+        return [day for days in pool.map(_replay_chunk, chunks) for day in days]
+
+
+# =============================================================================
+# RUN METRICS
+# =============================================================================
+
+def load_metrics() -> list[dict]:
+    if METRICS_FILE.exists():
+        with open(METRICS_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return []
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident set size of this process so far, in MB."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS, kilobytes elsewhere
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+class RunMetrics:
+    """Timings and counters for one run, appended to data/metrics.json.
+    
+    Each stage records [wall seconds, CPU seconds]; CPU time covers every
+    thread of this process but not analysis worker processes. With
+    `profile`, each stage also runs under cProfile and tracemalloc, and
+    writes <stage>.prof and <stage>.txt to data/profile/. cProfile only
+    sees the main thread, so feed downloads and parsing in the fetch pool
+    show up in the per-feed timings instead.
+    """
+    
+    def __init__(self, profile: bool = False):
+        self.run_at = datetime.now()
+        self.profile = profile
+        self.stages = {}
+        self.feeds = {}
+        self.counts = defaultdict(int)
+        self.started = (time.perf_counter(), time.process_time())
+    
+    @contextmanager
+    def stage(self, name: str):
+        if self.profile:
+            profiler = cProfile.Profile()
+            tracemalloc.start()
+            profiler.enable()
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            self.stages[name] = [round(time.perf_counter() - wall, 3),
+                                 round(time.process_time() - cpu, 3)]
+            if self.profile:
+                profiler.disable()
+                snapshot = tracemalloc.take_snapshot()
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                self.write_profile(name, profiler, snapshot, peak)
+    
+    def write_profile(self, name: str, profiler: cProfile.Profile,
+                      snapshot: tracemalloc.Snapshot, peak: int):
+        PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(PROFILE_DIR / f"{name}.prof")
+        with open(PROFILE_DIR / f"{name}.txt", 'w', encoding='utf-8') as f:
+            pstats.Stats(profiler, stream=f).sort_stats('cumulative').print_stats(25)
+            f.write(f"tracemalloc: peak {peak / 1e6:.1f} MB, largest allocations still held:\n")
+            for stat in snapshot.statistics('lineno')[:15]:
+                f.write(f"  {stat}\n")
+    
+    def record(self) -> dict:
+        wall, cpu = self.started
+        raw = self.counts.get('raw', 0)
+        unique = self.counts.get('unique', raw)
+        return {
+            'run_at': self.run_at.isoformat(timespec='seconds'),
+            'wall': round(time.perf_counter() - wall, 3),
+            'cpu': round(time.process_time() - cpu, 3),
+            'peak_rss_mb': peak_rss_mb(),
+            'stages': self.stages,
+            'counts': self.counts,
+            'dedup_rate': round(1 - unique / raw, 4) if raw else 0,
+            'feeds': self.feeds,
+        }
+    
+    def save(self) -> dict:
+        """Append this run to data/metrics.json, keeping the last METRICS_RETENTION runs.
+        
+        Per-feed stats are written for the latest run only, to
+        data/feed_metrics.json, so the committed file stays small.
+        """
+        record = self.record()
+        runs = [{k: v for k, v in run.items() if k != 'feeds'}
+                for run in (load_metrics() + [record])[-METRICS_RETENTION:]]
+        DATA_DIR.mkdir(exist_ok=True)
+        with open(METRICS_FILE, 'w', encoding='utf-8') as f:
+            json.dump(runs, f, ensure_ascii=False, separators=(',', ':'))
+        with open(FEED_METRICS_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'run_at': record['run_at'], 'feeds': record['feeds']}, f,
+                      ensure_ascii=False, separators=(',', ':'))
+        return record
+
+
+# =============================================================================
+# READ API
+# =============================================================================
+
+STATUS_RANK = {'high': 0, 'elevated': 1, 'normal': 2, 'quiet': 3}
+
+
+def api_time(value: str) -> float:
+    """Epoch seconds of an ISO date or datetime query parameter (UTC unless it has an offset)."""
+    dt = datetime.fromisoformat(value)
+    return dt.timestamp() if dt.tzinfo else calendar.timegm(dt.timetuple())
+
+
+def api_count(params: dict, name: str, default: int) -> int:
+    """A count query parameter (?n=, ?limit=); negative values are rejected."""
+    value = int(params.get(name, default))
+    if value < 0:
+        raise ValueError(f"{name} must not be negative")
+    return value
+
+
+class ApiData:
+    """The latest published run, indexed for the read API.
+    
+    Articles come from the article store when there is one (the last
+    STORE_RETENTION_DAYS), otherwise from the country shards (the 24h window,
+    without per-article keywords). They are kept sorted by time with
+    per-country and per-keyword position lists, so a time range is two
+    bisections of one list.
+    """
+    
+    def __init__(self, index: dict, shards: dict, articles: list[tuple[float, dict]], history: dict):
+        self.index = index
+        self.shards = shards
+        self.history = history
+        articles.sort(key=lambda a: a[0])
+        self.times = [t for t, _ in articles]
+        self.articles = [a for _, a in articles]
+        self.by_country = defaultdict(list)
+        self.by_keyword = defaultdict(list)
+        for i, article in enumerate(self.articles):
+            for country in article['countries']:
+                self.by_country[country].append(i)
+            for word in article['keywords']:
+                self.by_keyword[word].append(i)
+        self.scores = {c: {k: v for k, v in entry.items() if k not in ('shard', 'hash')}
+                       for c, entry in index['countries'].items()}
+        self.slugs = {shard_name(c)[:-len('.json')]: c for c in self.scores}
+        self.ranked = sorted(self.scores, key=lambda c: (
+            STATUS_RANK.get(self.scores[c]['status'], len(STATUS_RANK)), -self.scores[c]['ratio']))
+    
+    @classmethod
+    def load(cls) -> 'ApiData':
+        with open(INDEX_FILE, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        
+        shards = {}
+        for country, entry in index['countries'].items():
+            try:
+                with open(DATA_DIR / entry['shard'], 'r', encoding='utf-8') as f:
+                    shards[country] = json.load(f)
+            except (OSError, ValueError, KeyError):
+                shards[country] = {field: [] for field in SHARD_FIELDS}
+        
+        articles = None
+        if ARTICLE_DB.exists():
+            try:
+                articles = cls.store_articles()
+            except sqlite3.Error:
+                pass  # Store busy or unreadable: fall back to the shards
+        if articles is None:
+            articles = cls.shard_articles(shards, api_time(index['generated_at']))
+        
+        return cls(index, shards, articles, load_history())
+    
+    @staticmethod
+    def store_articles() -> list[tuple[float, dict]]:
+        """(time, article) for each matched article in the store, read-only."""
+        conn = sqlite3.connect(f"file:{ARTICLE_DB}?mode=ro", uri=True)
+        try:
+            rows = conn.execute(
+                "SELECT title, url, source, sources, published, seen_at, lead, countries, keywords "
+                "FROM articles WHERE countries != '[]'").fetchall()
+        finally:
+            conn.close()
+        return [(to_epoch(published or seen_at) or 0, {
+            'title': title,
+            'url': url,
+            'source': source,
+            'sources': json.loads(sources) if sources else [source],
+            'published': to_epoch(published),
+            'lead': lead,
+            'countries': json.loads(countries),
+            'keywords': json.loads(keywords),
+        }) for title, url, source, sources, published, seen_at, lead, countries, keywords in rows]
+    
+    @staticmethod
+    def shard_articles(shards: dict, generated: float) -> list[tuple[float, dict]]:
+        """(time, article) for the articles listed in the shards, one per URL."""
+        articles = {}
+        for country, shard in shards.items():
+            for article in shard['articles']:
+                key = article.get('url') or article['title']
+                if key in articles:
+                    articles[key][1]['countries'].append(country)
+                    continue
+                published = to_epoch(article.get('published'))
+                articles[key] = (published or generated,
+                                 {**article, 'published': published, 'countries': [country], 'keywords': []})
+        return list(articles.values())
+    
+    def country(self, name: str) -> str:
+        """Country for a name or shard slug ('cote-d-ivoire'); LookupError if unknown."""
+        country = name if name in self.scores else self.slugs.get(name.lower())
+        if country is None:
+            raise LookupError(f"Unknown country: {name}")
+        return country
+    
+    def select(self, country: str | None = None, keyword: str | None = None,
+               start: float = float('-inf'), end: float = float('inf'),
+               limit: int = API_DEFAULT_LIMIT) -> dict:
+        """Newest `limit` articles timed in [start, end), for a country and/or keyword."""
+        if country is None and keyword is None:
+            positions = range(len(self.articles))
+        elif keyword is None:
+            positions = self.by_country.get(country, [])
+        elif country is None:
+            positions = self.by_keyword.get(keyword, [])
+        else:
+            positions = [i for i in self.by_keyword.get(keyword, [])
+                         if country in self.articles[i]['countries']]
+        
+        lo = bisect.bisect_left(positions, start, key=self.times.__getitem__)
+        hi = bisect.bisect_left(positions, end, key=self.times.__getitem__)
+        return {
+            'count': hi - lo,
+            'articles': [self.articles[i] for i in reversed(positions[max(lo, hi - limit):hi])],
+        }
+
+
+class ReadApi:
+    """Answers read API requests from the latest published run.
+    
+    Responses are built once and kept in an LRU cache. A new run rewrites
+    data/index.json, which reloads the data; cached responses are keyed by
+    the index's mtime, so they are never served for a later run. Windows
+    relative to now (?hours=, ?days=) are also keyed on the current
+    API_WINDOW_STEP, so they don't drift while a run stays published.
+    """
+    
+    def __init__(self, cache_size: int = API_CACHE_SIZE):
+        self.lock = threading.Lock()
+        self.stamp = None
+        self.data = None
+        self.respond = functools.lru_cache(maxsize=cache_size)(self.build)
+    
+    def refresh(self):
+        """Reload the data if a run has published since the last request."""
+        try:
+            stat = INDEX_FILE.stat()
+            stamp = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            stamp = None
+        if stamp == self.stamp:
+            return
+        with self.lock:
+            if stamp != self.stamp:
+                self.data = ApiData.load() if stamp else None
+                self.respond.cache_clear()
+                self.stamp = stamp
+    
+    def get(self, path: str, query: str) -> tuple[int, bytes, bytes | None, str]:
+        """(status, JSON body, gzipped body or None, ETag) for a GET request."""
+        self.refresh()
+        params = parse_qs(query)
+        now = None
+        if 'hours' in params or 'days' in params:
+            now = time.time() // API_WINDOW_STEP * API_WINDOW_STEP
+        return self.respond(self.stamp, path, query, now)
+    
+    def build(self, stamp, path: str, query: str,
+              now: float | None) -> tuple[int, bytes, bytes | None, str]:
+        params = {k: v[-1] for k, v in parse_qs(query).items()}
+        if self.data is None:
+            status, payload = 503, {'error': "No published run yet"}
+        else:
+            try:
+                status, payload = 200, self.route(self.data, path, params, now)
+            except LookupError as e:
+                status, payload = 404, {'error': str(e).strip("'")}
+            except ValueError as e:
+                status, payload = 400, {'error': str(e)}
+        
+        body = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        packed = gzip.compress(body, 6, mtime=0) if len(body) >= API_GZIP_MIN else None
+        # Weak: the gzipped and plain bodies share it
+        return status, body, packed, 'W/"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+    
+    @staticmethod
+    def route(data: ApiData, path: str, params: dict, now: float | None = None) -> dict:
+        parts = [unquote(p) for p in path.strip('/').split('/')]
+        if parts[0] != 'api':
+            raise LookupError(f"Not found: {path}")
+        parts = parts[1:]
+        
+        end = api_time(params['until']) if 'until' in params else float('inf')
+        now = time.time() if now is None else now
+        if 'hours' in params:
+            start = now - float(params['hours']) * 3600
+        elif 'days' in params:
+            start = now - float(params['days']) * 86400
+        else:
+            start = api_time(params['since']) if 'since' in params else float('-inf')
+        limit = min(api_count(params, 'limit', API_DEFAULT_LIMIT), API_MAX_LIMIT)
+        scores = data.scores
+        
+        if parts == ['summary']:
+            return {'generated_at': data.index['generated_at'], 'summary': data.index['summary']}
+        
+        if parts == ['top']:
+            region = params.get('region')
+            ranked = [c for c in data.ranked
+                      if region is None or COUNTRIES.get(c, {}).get('region') == region]
+            return {'generated_at': data.index['generated_at'],
+                    'countries': [{'country': c, **scores[c]} for c in ranked[:api_count(params, 'n', 10)]]}
+        
+        if parts == ['countries']:
+            return {'generated_at': data.index['generated_at'], 'countries': scores}
+        
+        if parts == ['articles']:
+            country = data.country(params['country']) if 'country' in params else None
+            return data.select(country, params.get('keyword', '').lower() or None, start, end, limit)
+        
+        if len(parts) == 2 and parts[0] == 'keywords':
+            keyword = parts[1].lower()
+            counts = [{'country': c, 'count': k['count']}
+                      for c, shard in data.shards.items() for k in shard['keywords']
+                      if k['word'].lower() == keyword]
+            counts.sort(key=lambda c: -c['count'])
+            return {'keyword': keyword, 'countries': counts,
+                    **data.select(None, keyword, start, end, limit)}
+        
+        if 2 <= len(parts) <= 3 and parts[0] == 'countries':
+            country = data.country(parts[1])
+            if len(parts) == 2:
+                return {'country': country, **scores[country], **data.shards[country]}
+            if parts[2] == 'articles':
+                return {'country': country, **data.select(country, None, start, end, limit)}
+            if parts[2] == 'history':
+                # ?n= days of history; ?days= only sets the time range of article lists
+                days = data.history['days']
+                days = days[max(len(days) - api_count(params, 'n', BASELINE_DAYS), 0):]
+                return {'country': country,
+                        'days': [{'date': d['date'], 'count': d['counts'].get(country)} for d in days]}
+        
+        raise LookupError(f"Not found: {path}")
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    """HTTP front end of a ReadApi, with ETag revalidation and gzip."""
+    
+    api: ReadApi = None
+    protocol_version = 'HTTP/1.1'  # Keep-alive
+    disable_nagle_algorithm = True  # Headers and body go out as two writes
+    
+    def do_GET(self):
+        url = urlparse(self.path)
+        status, body, packed, etag = self.api.get(url.path, url.query)
+        
+        if status == 200 and etag in self.headers.get('If-None-Match', ''):
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        
+        if packed is not None and 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = packed
+            self.send_response(status)
+            self.send_header('Content-Encoding', 'gzip')
+        else:
+            self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass  # One line per request would swamp the daemon's log
+
+
+def api_server(port: int = API_PORT, host: str = API_HOST) -> ThreadingHTTPServer:
+    """A read API server on host:port; call serve_forever() to run it."""
+    ApiHandler.api = ReadApi()
+    server = ThreadingHTTPServer((host, port), ApiHandler)
+    server.daemon_threads = True
+    return server
+
+
+# =============================================================================
+# DAEMON
+# =============================================================================
+
+def poll_interval(entries: list[dict], max_age: int | None = None, idle: int = 0,
+                  now: float | None = None) -> float:
+    """Seconds until a feed should be polled again.
+    
+    Aims for about one new item per poll: the mean gap between the items
+    it published over the last day, doubled for each poll in a row that
+    brought nothing new (up to 16x). Never sooner than the response's
+    cache lifetime. Clamped to DAEMON_MIN_POLL..DAEMON_MAX_POLL.
+    """
+    dated = [entry for entry in entries if entry.get('published') and not entry.get('estimated')]
+    recent = sum(1 for _ in iter_recent(dated, 24, now))
+    interval = 86400 / recent if recent else DAEMON_MAX_POLL
+    interval = max(interval * 2 ** min(idle, 4), max_age or 0)
+    return min(max(interval, DAEMON_MIN_POLL), DAEMON_MAX_POLL)
+
+
+def run_daemon(config: dict):
+    """Poll feeds on adaptive intervals, republishing when scores change.
+    
+    Runs until interrupted (Ctrl-C or SIGTERM). Matchers, per-entry
+    analysis and the day's baselines stay in memory between polls. The
+    window is re-scored after polls that bring new entries, and at least
+    every DAEMON_RESCORE seconds as articles age out of it. History,
+    the output files and data/metrics.json are only written when a
+    country's score has changed.
+    """
+    settings = {**FETCH_DEFAULTS, **config.get('fetch', {})}
+    feeds = [feed for section in config.get('feeds', {}).values() for feed in section]
+    cache = load_feed_cache()
+    if not feeds:
+        print("\nNo feeds configured")
+        return
+    host_slots = host_semaphores(feeds, settings)
+    
+    # (due time, feed index); feeds cached by an earlier run keep their schedule
+    queue = []
+    for i, feed in enumerate(feeds):
+        cached = cache.get(feed['url'])
+        due = (cached['fetched_at'] + poll_interval(cached['entries'], cached.get('max_age'))
+               if cached else 0)
+        heapq.heappush(queue, (due, i))
+    idle = [0] * len(feeds)
+    
+    memo = {}          # entry_id -> analyze_entry() record
+    series = HourlySeries.load()
+    daily = {}         # Daily baselines, loaded once per day
+    baselines = {}     # ...with same-window hourly baselines, refreshed each hour
+    baseline_day = baseline_hour = None
+    published = None   # Scores last written to the index
+    polled = {}        # Per-feed stats since the last publish
+    rescore_at = 0
+    
+    def score():
+        nonlocal memo, daily, baselines, baseline_day, baseline_hour, published, polled
+        metrics = RunMetrics()
+        metrics.feeds = polled
+        
+        with metrics.stage('dedup'):
+            entries = [entry for feed in feeds for entry in cache.get(feed['url'], {}).get('entries', [])]
+            unique = deduplicate(entries)
+            recent = filter_recent(unique)
+        metrics.counts.update(raw=len(entries), unique=len(unique), recent=len(recent))
+        
+        with metrics.stage('analyze'):
+            ids = [entry_id(entry) for entry in recent]
+            memo = {key: memo.get(key) or analyze_entry(entry) for key, entry in zip(ids, recent)}
+            results = aggregate_articles({**memo[key], 'sources': entry.get('sources') or memo[key]['sources']}
+                                         for key, entry in zip(ids, recent))
+        
+        with metrics.stage('score'):
+            pairs = extract_pairs(results)
+            now = datetime.now()
+            if baseline_day != now.date():
+                daily = calculate_baselines(load_history(BASELINE_DAYS))
+                baseline_day = now.date()
+            if baseline_hour != epoch_hour():
+                baseline_hour = epoch_hour()
+                baselines = {**daily, **series.baselines(baseline_hour)}
+            scores = score_countries(results, baselines, pairs)
+        
+        if scores == published:
+            return
+        with metrics.stage('write'):
+            publish(results, scores, pairs, series)
+        metrics.save()
+        
+        changed = [c for c in scores if not published or scores[c] != published[c]]
+        high = sum(1 for s in scores.values() if s['status'] == 'high')
+        elevated = sum(1 for s in scores.values() if s['status'] == 'elevated')
+        print(f"  {datetime.now():%H:%M} ✅ Republished: {len(changed)} countries changed  "
+              f"🔴 {high}  🟡 {elevated}", flush=True)
+        published, polled = scores, {}
+    
+    def stop(signum, frame):
+        sys.exit(0)
+    
+    signal.signal(signal.SIGTERM, stop)
+    workers = max(int(settings['concurrency']), 1)
+    print(f"\n📡 Polling {len(feeds)} feeds (Ctrl-C to stop)...", flush=True)
+    
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            while True:
+                now = time.time()
+                due = []
+                while queue and queue[0][0] <= now:
+                    due.append(heapq.heappop(queue)[1])
+                
+                futures = {pool.submit(poll_feed, feeds[i], settings, host_slots,
+                                       cache.get(feeds[i]['url']), min_interval=0): i
+                           for i in due}
+                fresh = 0
+                for future in as_completed(futures):
+                    i = futures[future]
+                    feed = feeds[i]
+                    entries, record, status, timings, error = future.result()
+                    polled[feed['name']] = {'status': status, 'entries': len(entries),
+                                            **{k: round(v, 3) if isinstance(v, float) else v
+                                               for k, v in timings.items()}}
+                    
+                    if error is None:
+                        known = {entry_id(e) for e in cache.get(feed['url'], {}).get('entries', [])}
+                        new = sum(1 for e in entries if entry_id(e) not in known)
+                        cache[feed['url']] = record
+                    else:
+                        new = 0
+                    fresh += new
+                    idle[i] = 0 if new else idle[i] + 1
+                    
+                    cached = cache.get(feed['url'], {})
+                    interval = poll_interval(cached.get('entries', []), cached.get('max_age'), idle[i])
+                    heapq.heappush(queue, (time.time() + interval, i))
+                    outcome = f"✗ {error}" if error is not None else f"✓ {new} new"
+                    print(f"  {datetime.now():%H:%M} {feed['name']}... {outcome} "
+                          f"(next in {interval / 60:.0f}m)", flush=True)
+                
+                if due:
+                    save_feed_cache(cache)
+                if fresh or time.time() >= rescore_at:
+                    score()
+                    rescore_at = time.time() + DAEMON_RESCORE
+                
+                time.sleep(max(min(queue[0][0], rescore_at) - time.time(), 1))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        save_feed_cache(cache)
+        print("\n👋 Daemon stopped", flush=True)
+
+
 # =============================================================================
 # MAIN
 # =============================================================================
 
+def option(name: str, count: int = 1) -> list[str]:
+    """Values following `name` on the command line, e.g. ['4'] for --workers 4."""
+    if name not in sys.argv:
+        return []
+    i = sys.argv.index(name) + 1
+    return [v for v in sys.argv[i:i + count] if not v.startswith('--')]
+
+
 def main():
     print("=" * 55)
     print("  MyMonitoringBuddy! - Africa News Monitor")
     print("=" * 55)
     
+    if '--backtest' in sys.argv:
+        print("\n📈 Backtesting baseline methods over full history...")
+        for method, tiers in backtest().items():
+            print(f"   {method:<7} 🔴 {tiers['high']:>5}  🟡 {tiers['elevated']:>5}  "
+                  f"🟢 {tiers['normal']:>5}  ⚪ {tiers['quiet']:>5}  ({tiers['ms']} ms)")
+        return
+    
+    if '--replay' in sys.argv:
+        dates = option('--replay', 2)
+        if not dates:
+            print("\nUsage: fetcher.py --replay START [END] [--workers N] [--recompute-baselines]")
+            return
+        start, end = dates[0], dates[-1]
+        workers = int(option('--workers')[0]) if option('--workers') else None
+        recompute = '--recompute-baselines' in sys.argv
+        
+        print(f"\n⏪ Replaying archived runs {start} → {end}"
+              f"{' (recomputed baselines)' if recompute else ''}...")
+        started = time.perf_counter()
+        days = replay(start, end, workers, recompute)
+        for day in days:
+            changes = ', '.join(f"{c}: {old}→{new}" for c, (old, new) in sorted(day['changes'].items()))
+            print(f"   {day['date']}  {day['runs']} runs, {day['changed_runs']} changed  {changes or 'no change'}")
+        runs = sum(day['runs'] for day in days)
+        print(f"\n   {runs} runs over {len(days)} days in {time.perf_counter() - started:.1f}s")
+        return
+    
+    if '--serve' in sys.argv:
+        port = int(option('--serve')[0]) if option('--serve') else API_PORT
+        server = api_server(port)
+        print(f"\n🔌 Read API on http://{API_HOST}:{port}/api/")
+        if '--daemon' not in sys.argv:
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            return
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    
+    if '--daemon' in sys.argv:
+        run_daemon(load_config())
+        return
+    
     if '--dry-run' in sys.argv:
         config = load_config()
         print("\n[DRY RUN] Would fetch:")
@@ -454,60 +2723,126 @@ def main():
     print("\n📋 Loading config...")
     config = load_config()
     
-    # Fetch
-    print("\n📡 Fetching feeds...")
-    entries = fetch_feeds(config)
-    print(f"   Raw entries: {len(entries)}")
+    # A streaming run reads each feed's cached entries only when it needs them
+    feed_cache = load_feed_cache(entries='--stream' not in sys.argv)
+    store = open_store() if '--store' in sys.argv else None
+    archive = RunArchive() if '--archive' in sys.argv else None
+    workers = int(option('--workers')[0]) if option('--workers') else ANALYSIS_WORKERS
+    metrics = RunMetrics(profile='--profile' in sys.argv)
+    added = 0
     
-    # Deduplicate
-    print("\n🔄 Deduplicating...")
-    unique = deduplicate(entries)
-    print(f"   Unique: {len(unique)} (-{len(entries) - len(unique)} dupes)")
+    if '--stream' in sys.argv:
+        # Streaming: entries are deduplicated, filtered and matched as feeds
+        # are parsed, in config order so clusters keep the same first member
+        # as in batch mode. Each feed's cache record goes to disk as soon as
+        # it completes, so only unique recent articles stay in memory.
+        print("\n📡 Fetching and analyzing feeds (streaming)...")
+        stats = metrics.counts
+        with metrics.stage('stream'):
+            stream = iter_feed_entries(config, feed_cache, metrics.feeds)
+            if archive is not None:
+                stream = archive.tee(stream)
+            stream = counted(stream, stats, 'raw')
+            stream = counted(iter_unique(stream), stats, 'unique')
+            if store is not None:
+                added = store_articles(store, stream, workers=workers)
+            else:
+                results = analyze_articles(counted(iter_recent(stream), stats, 'recent'))
+            save_feed_cache(feed_cache)
+        print(f"   Raw entries: {stats['raw']}")
+        print(f"   Unique: {stats['unique']} (-{stats['raw'] - stats['unique']} dupes)")
+        if store is None:
+            print(f"   Recent: {stats['recent']}")
+    else:
+        # Fetch
+        print("\n📡 Fetching feeds...")
+        with metrics.stage('fetch'):
+            entries = fetch_feeds(config, feed_cache, metrics.feeds)
+            save_feed_cache(feed_cache)
+            if archive is not None:
+                entries = list(archive.tee(entries))
+        metrics.counts['raw'] = len(entries)
+        print(f"   Raw entries: {len(entries)}")
+        
+        # Deduplicate
+        print("\n🔄 Deduplicating...")
+        with metrics.stage('dedup'):
+            unique = deduplicate(entries)
+        metrics.counts['unique'] = len(unique)
+        print(f"   Unique: {len(unique)} (-{len(entries) - len(unique)} dupes)")
+        
+        if store is not None:
+            print("\n🗄️  Updating article store...")
+            with metrics.stage('store'):
+                added = store_articles(store, unique, workers=workers)
+        else:
+            # Filter recent
+            print("\n⏰ Filtering to 24h...")
+            with metrics.stage('filter'):
+                index = RecencyIndex(unique)
+                recent = index.window(24)
+            metrics.counts['recent'] = len(recent)
+            windows = '  '.join(f"{hours}h {index.count(hours)}" for hours in RECENT_WINDOWS)
+            print(f"   Recent: {len(recent)} ({windows})")
+            
+            # Analyze
+            print(f"\n🌍 Analyzing{f' ({workers} workers)' if workers > 1 else ''}...")
+            with metrics.stage('analyze'):
+                results = analyze_articles(recent, workers)
     
-    # Filter recent
-    print("\n⏰ Filtering to 24h...")
-    recent = filter_recent(unique)
-    print(f"   Recent: {len(recent)}")
+    if store is not None:
+        # Only articles unseen in earlier runs were matched; the 24h window
+        # comes from the store
+        with metrics.stage('window'):
+            evicted = evict_articles(store)
+            print(f"   New articles: {added}  Evicted: {evicted}")
+            print("\n🌍 Assembling 24h window from store...")
+            results = aggregate_articles(load_window(store))
+            store.close()
+        metrics.counts.update(new=added, evicted=evicted)
     
-    # Analyze
-    print("\n🌍 Analyzing...")
-    results = analyze_articles(recent)
     active = sum(1 for d in results.values() if d['articles'])
     print(f"   Countries with coverage: {active}/54")
     
     # Keyword pairs
     print("\n🔗 Finding keyword pairs...")
-    pairs = extract_pairs(results)
+    with metrics.stage('pairs'):
+        pairs = extract_pairs(results)
     with_pairs = sum(1 for p in pairs.values() if p)
     print(f"   Countries with pairs: {with_pairs}")
     
     # Baseline
     print("\n📊 Computing baselines...")
-    history = load_history()
-    baselines = calculate_baselines(history)
+    with metrics.stage('baselines'):
+        history = load_history(BASELINE_DAYS)
+        baselines = calculate_baselines(history)
+        # Same 24h window on earlier days, where the hourly series has enough of them
+        baselines.update(HourlySeries.load().baselines(epoch_hour()))
     
     # Score
     print("\n🎯 Scoring...")
-    today_counts = {c: len(d['articles']) for c, d in results.items()}
-    scores = score_countries(results, baselines, pairs)
+    with metrics.stage('score'):
+        scores = score_countries(results, baselines, pairs)
     
     high = sum(1 for s in scores.values() if s['status'] == 'high')
     elevated = sum(1 for s in scores.values() if s['status'] == 'elevated')
     print(f"   🔴 High: {high}  🟡 Elevated: {elevated}")
     
-    # Update history
-    history = update_history(history, today_counts)
-    save_history(history)
-    
-    # Output
-    timestamp = datetime.now().isoformat()
-    output = generate_output(results, scores, pairs, timestamp)
+    with metrics.stage('write'):
+        if archive is not None:
+            archive.close(scores, baselines)
+        
+        # Update history and output
+        written = publish(results, scores, pairs)
     
-    DATA_DIR.mkdir(exist_ok=True)
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    run = metrics.save()
+    memory = f", peak RSS {run['peak_rss_mb']} MB" if run['peak_rss_mb'] else ''
+    stages = '  '.join(f"{name} {wall:.2f}s" for name, (wall, _) in run['stages'].items())
+    print(f"\n⏱️  {run['wall']:.1f}s (CPU {run['cpu']:.1f}s{memory}): {stages}")
+    if metrics.profile:
+        print(f"   Profiles written to {PROFILE_DIR}/")
     
-    print(f"\n✅ Saved to {OUTPUT_FILE}")
+    print(f"\n✅ Saved to {INDEX_FILE} ({written} of {len(scores)} country shards changed)")
     print("=" * 55)
 
 
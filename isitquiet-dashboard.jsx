@@ -10,6 +10,7 @@
  * - Row 1: Explainer (280px) + Region Filter (flex)
  * - Row 2: Treemap (flex) + Sources Panel (380px)
  * - Row 3: Methodology (full width)
+ * - Row 4: Run durations (full width, when data/metrics.json exists)
  * 
  * @version 2.0
  * @author MyMonitoringBuddy Project
@@ -565,6 +566,7 @@ const SourcesPanel = ({ selectedCountry, countryData }) => {
 
   const color = getStatusColor(countryData.status);
   const articles = countryData.articles || [];
+  const shardLoading = countryData.articles === undefined && countryData.article_count > 0;
 
   return (
     <div style={{
@@ -619,7 +621,16 @@ const SourcesPanel = ({ selectedCountry, countryData }) => {
         gap: '10px',
         paddingRight: '4px'
       }}>
-        {articles.length === 0 ? (
+        {shardLoading ? (
+          <div style={{
+            color: COLORS.textMuted,
+            fontSize: '13px',
+            textAlign: 'center',
+            padding: '30px 20px'
+          }}>
+            Loading articles...
+          </div>
+        ) : articles.length === 0 ? (
           <div style={{
             color: COLORS.textMuted,
             fontSize: '13px',
@@ -683,7 +694,7 @@ const SourcesPanel = ({ selectedCountry, countryData }) => {
                   {article.source}
                 </span>
                 {article.published && (
-                  <span>{new Date(article.published).toLocaleDateString()}</span>
+                  <span>{new Date(typeof article.published === 'number' ? article.published * 1000 : article.published).toLocaleDateString()}</span>
                 )}
               </div>
               
@@ -793,6 +804,105 @@ const Methodology = () => (
   </div>
 );
 
+// Bar colors per fetcher stage (see RunMetrics in fetcher.py)
+const STAGE_COLORS = {
+  fetch: COLORS.accent,
+  stream: COLORS.accent,
+  dedup: '#8b5cf6',
+  store: COLORS.yellow,
+  window: COLORS.yellow,
+  filter: COLORS.textSec,
+  analyze: COLORS.green,
+};
+
+/**
+ * RunDurations Component
+ * Full width chart of recent fetcher run times from data/metrics.json,
+ * one bar per run, stacked by pipeline stage
+ */
+const RunDurations = () => {
+  const [runs, setRuns] = React.useState([]);
+  
+  React.useEffect(() => {
+    fetch('./data/metrics.json')
+      .then(res => res.ok ? res.json() : [])
+      .then(json => setRuns(json.slice(-60)))
+      .catch(() => setRuns([]));  // Metrics are optional
+  }, []);
+  
+  if (!runs.length) return null;
+  
+  const width = 1000, height = 120;
+  const maxWall = Math.max(...runs.map(r => r.wall), 1);
+  const barWidth = width / runs.length;
+  const latest = runs[runs.length - 1];
+  const stages = [...new Set(runs.flatMap(r => Object.keys(r.stages)))];
+  
+  return (
+    <div style={{
+      background: COLORS.bgCard,
+      borderRadius: '12px',
+      padding: '20px'
+    }}>
+      <div style={{
+        display: 'flex',
+        justifyContent: 'space-between',
+        alignItems: 'baseline',
+        flexWrap: 'wrap',
+        gap: '10px',
+        marginBottom: '12px'
+      }}>
+        <h3 style={{ fontSize: '13px', fontWeight: 600, color: COLORS.accent, margin: 0 }}>
+          RUN DURATIONS
+        </h3>
+        <span style={{ fontSize: '12px', color: COLORS.textMuted }}>
+          Last run {latest.wall.toFixed(1)}s
+          {latest.peak_rss_mb ? ` • ${latest.peak_rss_mb} MB peak` : ''}
+          {` • ${Math.round(latest.dedup_rate * 100)}% duplicates`}
+          {` • max ${maxWall.toFixed(1)}s over ${runs.length} runs`}
+        </span>
+      </div>
+      
+      <svg viewBox={`0 0 ${width} ${height}`} preserveAspectRatio="none"
+           style={{ width: '100%', height: `${height}px`, display: 'block' }}>
+        {runs.map((run, i) => {
+          let y = height;
+          return (
+            <g key={run.run_at}>
+              <title>
+                {`${new Date(run.run_at).toLocaleString()}: ${run.wall.toFixed(1)}s\n` +
+                  Object.entries(run.stages).map(([name, [wall]]) => `${name} ${wall.toFixed(2)}s`).join('\n')}
+              </title>
+              {Object.entries(run.stages).map(([name, [wall]]) => {
+                const h = wall / maxWall * height;
+                y -= h;
+                return (
+                  <rect key={name} x={i * barWidth + 1} y={y} width={Math.max(barWidth - 2, 1)} height={h}
+                        fill={STAGE_COLORS[name] || COLORS.textMuted} />
+                );
+              })}
+            </g>
+          );
+        })}
+      </svg>
+      
+      <div style={{ display: 'flex', gap: '14px', flexWrap: 'wrap', marginTop: '10px', fontSize: '11px', color: COLORS.textSec }}>
+        {stages.map(name => (
+          <span key={name} style={{ display: 'flex', alignItems: 'center', gap: '6px' }}>
+            <span style={{
+              width: '10px',
+              height: '10px',
+              background: STAGE_COLORS[name] || COLORS.textMuted,
+              borderRadius: '2px'
+            }} />
+            {name}
+          </span>
+        ))}
+      </div>
+    </div>
+  );
+};
+
 // =============================================================================
 // MAIN DASHBOARD COMPONENT
 // =============================================================================
@@ -805,12 +915,13 @@ function Dashboard() {
   });
   const [selectedCountry, setSelectedCountry] = React.useState(null);
   const [region, setRegion] = React.useState('All Africa');
+  const [shards, setShards] = React.useState({});
   const [loading, setLoading] = React.useState(true);
   const [error, setError] = React.useState(null);
   
-  // Load data from backend
+  // Load the summary index from backend (articles come from per-country shards)
   React.useEffect(() => {
-    fetch('./data/output.json')
+    fetch('./data/index.json')
       .then(res => {
         if (!res.ok) throw new Error(`HTTP ${res.status}: ${res.statusText}`);
         return res.json();
@@ -842,8 +953,27 @@ function Dashboard() {
     setSelectedCountry(prev => prev === name ? null : name);
   };
   
-  // Get data for selected country
-  const selectedCountryData = selectedCountry ? data.countries[selectedCountry] : null;
+  // Lazy-load the selected country's shard (keywords, articles, sources)
+  React.useEffect(() => {
+    const entry = selectedCountry && data.countries[selectedCountry];
+    if (!entry || !entry.shard || shards[selectedCountry]) return;
+    
+    fetch(`./data/${entry.shard}?v=${entry.hash}`)
+      .then(res => {
+        if (!res.ok) throw new Error(`HTTP ${res.status}: ${res.statusText}`);
+        return res.json();
+      })
+      .then(shard => setShards(prev => ({ ...prev, [selectedCountry]: shard })))
+      .catch(err => {
+        console.error(`Failed to load ${entry.shard}:`, err);
+        setShards(prev => ({ ...prev, [selectedCountry]: { articles: [] } }));
+      });
+  }, [selectedCountry, data.countries, shards]);
+  
+  // Get data for selected country (articles stay undefined until its shard loads)
+  const selectedCountryData = selectedCountry
+    ? { ...data.countries[selectedCountry], ...shards[selectedCountry] }
+    : null;
   
   // Loading state
   if (loading) {
@@ -887,7 +1017,7 @@ function Dashboard() {
           {error}
         </div>
         <div style={{ fontSize: '12px', color: COLORS.textMuted, marginTop: '20px' }}>
-          Make sure <code style={{ background: COLORS.bgCard, padding: '2px 6px', borderRadius: '4px' }}>data/output.json</code> exists and is accessible.
+          Make sure <code style={{ background: COLORS.bgCard, padding: '2px 6px', borderRadius: '4px' }}>data/index.json</code> exists and is accessible.
         </div>
       </div>
     );
@@ -971,6 +1101,9 @@ function Dashboard() {
         {/* ROW 3: Methodology */}
         <Methodology />
         
+        {/* ROW 4: Run durations */}
+        <RunDurations />
+        
         {/* Footer */}
         <div style={{
           textAlign: 'center',